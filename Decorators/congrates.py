@@ -1,7 +1,54 @@
-import streamlit as st
+import bisect
 import datetime
+import functools
 import random
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
+
+# Hour of day -> greeting bucket (1 = morning 5-11, 2 = afternoon 12-17, 3 = evening)
+_HOUR_BUCKET = (3, 3, 3, 3, 3,
+                1, 1, 1, 1, 1, 1, 1,
+                2, 2, 2, 2, 2, 2,
+                3, 3, 3, 3, 3, 3)
+
+# Upper bounds (exclusive) on days since last login for the returning-user greetings:
+# same day, one day, within a week, and anything older
+_RETURNING_DAY_THRESHOLDS = (1, 2, 7)
+
+
+def _same_day_greeting(user_name: str, delta: datetime.timedelta) -> str:
+    hours = delta.seconds // 3600
+    if hours < 1:
+        return f"👋 Welcome back, {user_name}! Nice to see you again so soon."
+    return f"🔄 Hello again, {user_name}! Back for more after {hours} hours?"
+
+
+def _one_day_greeting(user_name: str, delta: datetime.timedelta) -> str:
+    return f"👋 Welcome back, {user_name}! It's been a day since your last visit."
+
+
+def _week_greeting(user_name: str, delta: datetime.timedelta) -> str:
+    return f"👋 Good to see you, {user_name}! It's been {delta.days} days since your last login."
+
+
+def _long_absence_greeting(user_name: str, delta: datetime.timedelta) -> str:
+    return f"🎉 Welcome back, {user_name}! We've missed you these past {delta.days} days."
+
+
+_RETURNING_GREETINGS = (_same_day_greeting, _one_day_greeting, _week_greeting, _long_absence_greeting)
+
+
+@functools.lru_cache(maxsize=1)
+def _time_context_for_minute(minute: int):
+    """Return (hour, weekday, (month, day)) for the given epoch minute"""
+    now = datetime.datetime.now()
+    return now.hour, now.weekday(), (now.month, now.day)
+
+
+def _time_context():
+    """Return (hour, weekday, (month, day)) shared by all greetings for a minute"""
+    return _time_context_for_minute(int(time.time() // 60))
+
 
 class GreetingService:
     """Service for generating personalized greetings based on context"""
@@ -98,6 +145,24 @@ class GreetingService:
             (10, 31): "🎃 Happy Halloween, {}!",
             # Add more special dates as needed
         }
+        
+        # Precompute the merged (time bucket, role) pools once, so get_greeting
+        # only has to index into an immutable tuple on every rerun.
+        # Buckets: 0 = weekend, 1 = morning, 2 = afternoon, 3 = evening
+        base_pools = {
+            (True, 0): self.weekend_greetings,
+            (False, 1): self.morning_greetings,
+            (False, 2): self.afternoon_greetings,
+            (False, 3): self.evening_greetings,
+        }
+        # Instance-owned generator, so greetings do not contend on the global random lock
+        self._rng = random.Random()
+        
+        self._pool_by_key: Dict[Tuple[bool, int, Optional[str]], Tuple[str, ...]] = {}
+        for (is_weekend, bucket), base in base_pools.items():
+            self._pool_by_key[(is_weekend, bucket, None)] = tuple(base)
+            for role, role_greetings in self.role_specific_greetings.items():
+                self._pool_by_key[(is_weekend, bucket, role)] = tuple(base + role_greetings)
     
     def get_greeting(self, 
                      user_name: str = "guest", 
@@ -118,11 +183,8 @@ class GreetingService:
         # Convert user_role to lowercase for case-insensitive matching
         user_role = user_role.lower() if isinstance(user_role, str) else "guest"
         
-        # Get current date and time
-        now = datetime.datetime.now()
-        hour = now.hour
-        day_of_week = now.weekday()  # 0-6 (Monday is 0)
-        current_date = (now.month, now.day)
+        # Get current date and time (weekday is 0-6, Monday is 0)
+        hour, day_of_week, current_date = _time_context()
         
         # Check for special days first
         if current_date in self.special_day_greetings:
@@ -131,52 +193,46 @@ class GreetingService:
         # Check if it's weekend
         is_weekend = day_of_week >= 5  # 5 = Saturday, 6 = Sunday
         
-        # Select appropriate greeting pool based on time and day
-        if is_weekend:
-            greeting_pool = self.weekend_greetings
-        elif 5 <= hour < 12:
-            greeting_pool = self.morning_greetings
-        elif 12 <= hour < 18:
-            greeting_pool = self.afternoon_greetings
-        else:
-            greeting_pool = self.evening_greetings
-        
-        # Add role-specific greetings to the pool if available
-        if user_role in self.role_specific_greetings:
-            greeting_pool.extend(self.role_specific_greetings[user_role])
+        # Select the precomputed pool for this time bucket and role
+        bucket = 0 if is_weekend else _HOUR_BUCKET[hour]
+        key = (is_weekend, bucket, user_role)
+        if key not in self._pool_by_key:
+            key = (is_weekend, bucket, None)
         
-        # Select a random greeting from the pool
-        greeting = random.choice(greeting_pool)
+        # Select a random greeting from the pool, already formatted with the user name
+        greeting = self._rng.choice(self._formatted_pool(key, user_name))
         if is_guest:
+            import streamlit as st
             st.title("⚠️ DEMO MODE !")
-        # Format with user name
-        return greeting.format(user_name)
+        return greeting
     
-    def get_returning_user_greeting(self, user_name: str, last_login: Optional[datetime.datetime] = None) -> str:
+    @functools.lru_cache(maxsize=256)
+    def _formatted_pool(self, key: Tuple[bool, int, Optional[str]], user_name: str) -> Tuple[str, ...]:
+        """Return the pool for key with every greeting formatted for user_name, cached per name"""
+        return tuple(template.format(user_name) for template in self._pool_by_key[key])
+    
+    def get_returning_user_greeting(self, user_name: str, last_login: Optional[datetime.datetime] = None,
+                                    now: Optional[datetime.datetime] = None) -> str:
         """Generate a greeting for returning users based on their last login time"""
         if not last_login:
             return self.get_greeting(user_name)
             
-        now = datetime.datetime.now()
-        delta = now - last_login
-        
-        if delta.days == 0:
-            # Same day return
-            hours = delta.seconds // 3600
-            if hours < 1:
-                return f"👋 Welcome back, {user_name}! Nice to see you again so soon."
-            else:
-                return f"🔄 Hello again, {user_name}! Back for more after {hours} hours?"
-        elif delta.days == 1:
-            return f"👋 Welcome back, {user_name}! It's been a day since your last visit."
-        elif delta.days < 7:
-            return f"👋 Good to see you, {user_name}! It's been {delta.days} days since your last login."
-        else:
-            return f"🎉 Welcome back, {user_name}! We've missed you these past {delta.days} days."
-
-
-# Create a singleton instance of the greeting service
-_greeting_service = GreetingService()
+        # Raw now() unless the caller has one, the delta needs sub-minute resolution
+        delta = (now or datetime.datetime.now()) - last_login
+        index = bisect.bisect_right(_RETURNING_DAY_THRESHOLDS, delta.days)
+        return _RETURNING_GREETINGS[index](user_name, delta)
+
+
+# Singleton instance of the greeting service, built on first use rather than at import
+_greeting_service: Optional[GreetingService] = None
+
+
+def _get_greeting_service() -> GreetingService:
+    """Return the shared GreetingService, creating it on the first call"""
+    global _greeting_service
+    if _greeting_service is None:
+        _greeting_service = GreetingService()
+    return _greeting_service
 
 def congrats(user_name: str = "Guest", user_role: str = "guest", user_data: Optional[Dict[str, Any]] = None) -> str:
     """
@@ -190,10 +246,7 @@ def congrats(user_name: str = "Guest", user_role: str = "guest", user_data: Opti
     Returns:
         str: A personalized greeting
     """
-    if user_name == "guest":
-        return _greeting_service.get_greeting(user_name, user_role, user_data, is_guest=True)
-    else:
-        return _greeting_service.get_greeting(user_name, user_role, user_data)
+    return _get_greeting_service().get_greeting(user_name, user_role, user_data, is_guest=user_name == "guest")
 
 
 def welcome_returning_user(user_name: str, last_login: Optional[datetime.datetime] = None) -> str:
@@ -207,4 +260,4 @@ def welcome_returning_user(user_name: str, last_login: Optional[datetime.datetim
     Returns:
         str: A personalized greeting based on last login time
     """
-    return _greeting_service.get_returning_user_greeting(user_name, last_login)
\ No newline at end of file
+    return _get_greeting_service().get_returning_user_greeting(user_name, last_login)
\ No newline at end of file
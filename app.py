@@ -1,10 +1,8 @@
 import streamlit as st
-from pathlib import Path
 import time
 
 # Import controllers
-from controllers.auth_controller import AuthenticationController
-from controllers.user_controller import UserController
+from controllers.auth_controller import AuthenticationController, streamlit_login_state, user_secret_fields
 
 # Set up app configuration
 st.set_page_config(
@@ -14,6 +12,38 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Static sidebar and welcome-screen markdown, built once per process instead of per rerun
+APP_PAGES_MD = """
+## App Pages
+
+- **Homepage**: Overview of the active users and their projects
+- **Dashboard**: Overview of Fitbit activity and device stats
+- **Fitbit Management**: Manage Fitbit devices 
+- **Alerts Configuration**: Configure alerts for devices and EMA
+- **NOVA Qualtrics Management**: Manage buldog and Qualtrics data
+- **APPSHEET Management**: Manage AppSheet data
+
+---
+
+### Need Help?
+Contact support: edenede2@gmail.com
+"""
+
+FEATURES_MD = """
+## Features Available After Login:
+
+- **Dashboard**: Overview of Fitbit activity and stats
+- **User Management**: Manage user accounts and permissions
+- **Device Tracking**: Monitor Fitbit devices and sync status
+- **Data Analysis**: Analyze collected health and activity data
+- **Reports**: Generate and export reports
+
+---
+
+### Need Help?
+Contact support: edenede2@gmail.com
+"""
+
 def main():
     """Main application function - handles authentication and session state"""
     # Initialize authentication controller
@@ -23,10 +53,7 @@ def main():
     auth_controller.render_auth_ui()
     
     # Check if user is logged in (either through Streamlit auth or demo mode)
-    try:
-        is_streamlit_logged_in = st.user is not None and hasattr(st.user, 'is_logged_in') and st.user.is_logged_in
-    except Exception:
-        is_streamlit_logged_in = False
+    is_streamlit_logged_in, streamlit_email = streamlit_login_state()
     
     is_logged_in = is_streamlit_logged_in or st.session_state.get('user_role') is not None
     
@@ -35,31 +62,25 @@ def main():
             # Store spreadsheet in session state
             if 'spreadsheet' not in st.session_state:
                 st.session_state.spreadsheet = auth_controller.get_spreadsheet()
-
-            if 'fibro_spreadsheet' not in st.session_state:
-                st.session_state.fibro_spreadsheet = auth_controller.get_fibro_spreasheet()
+            # The Fibro EMA spreadsheet is connected on demand by the APPSHEET page
             
             # Get user info - either from Streamlit auth or session state (for demo)
             if is_streamlit_logged_in:
-                user_email = getattr(st.user, 'email', None)
+                user_email = streamlit_email
                 if user_email is None:
                     st.error("Could not retrieve user email. Please refresh and try again.")
                     st.stop()
-                user_project = st.secrets.get(user_email.split('@')[0], 'None')
-                if user_project is not None:
-                    user_project = user_project.split(',')[0]
-                user_role = st.secrets.get(user_email.split('@')[0], 'Guest')
-                if user_role != 'Guest':
-                    user_role = user_role.split(',')[1].strip()
+                # Fields of the user's secrets entry, parsed once and cached across reruns
+                fields = user_secret_fields(user_email)
+                user_project = fields[0] if fields else 'None'
+                user_role = fields[1].strip() if len(fields) > 1 else 'Guest'
 
                 # user = UserController().get_user_by_email(user_email)
                 
                 # if user is not None:
                 #     st.session_state.user_role = user.get('role', 'Guest')
                 #     st.session_state.user_project = user.get('project', 'None')
-                st.session_state.user_role = user_role
-                st.session_state.user_project = user_project
-                st.session_state.user_email = user_email
+                st.session_state.update(user_role=user_role, user_project=user_project, user_email=user_email)
             else:
                 # Demo mode
                 st.session_state.user_email = "demo@example.com"
@@ -68,21 +89,8 @@ def main():
             st.sidebar.button("Logout", on_click=auth_controller.logout_user)
             st.sidebar.info("To log out, click the 'Logout' button above.")
             
-            # Add page descriptions
-            st.sidebar.markdown("## App Pages")
-            st.sidebar.markdown("""
-            - **Homepage**: Overview of the active users and their projects
-            - **Dashboard**: Overview of Fitbit activity and device stats
-            - **Fitbit Management**: Manage Fitbit devices 
-            - **Alerts Configuration**: Configure alerts for devices and EMA
-            - **NOVA Qualtrics Management**: Manage buldog and Qualtrics data
-            - **APPSHEET Management**: Manage AppSheet data
-            """)
-            
-            # Add support information
-            st.sidebar.markdown("---")
-            st.sidebar.markdown("### Need Help?")
-            st.sidebar.markdown("Contact support: edenede2@gmail.com")
+            # Page descriptions and support information, in a single markdown element
+            st.sidebar.markdown(APP_PAGES_MD)
 
             st.title("Welcome to the Fitbit Management System")
             st.write("You are logged in as: **{}**".format(st.session_state.user_email))
@@ -110,20 +118,8 @@ def main():
         st.info("Use the sidebar to log in. Click the 'login with google' button to authenticate.")
         st.sidebar.button("login with google", on_click=auth_controller.login_with_google)
         
-        # Add page descriptions for non-logged in users
-        st.markdown("## Features Available After Login:")
-        st.markdown("""
-        - **Dashboard**: Overview of Fitbit activity and stats
-        - **User Management**: Manage user accounts and permissions
-        - **Device Tracking**: Monitor Fitbit devices and sync status
-        - **Data Analysis**: Analyze collected health and activity data
-        - **Reports**: Generate and export reports
-        """)
-        
-        # Add support information
-        st.markdown("---")
-        st.markdown("### Need Help?")
-        st.markdown("Contact support: edenede2@gmail.com")
+        # Page descriptions for non-logged in users and support information, in a single markdown element
+        st.markdown(FEATURES_MD)
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 from st_aggrid import AgGrid, GridUpdateMode, DataReturnMode
 from st_aggrid.grid_options_builder import GridOptionsBuilder
+import copy
+import functools
 import polars as pl
 import pandas as pd
 import streamlit as st
@@ -20,14 +22,21 @@ def ag_filter(dtype: pl.DataType) -> str:
 # ------------------------------------------------------------------ #
 
 def build_grid_options(df_pl: pl.DataFrame, *, bool_editable: bool, selection_mode="multiple") -> dict:
-    gd = GridOptionsBuilder.from_dataframe(df_pl.to_pandas())
+    # The options depend only on the schema, so reruns over an unchanged frame reuse them;
+    # hand out a copy since AgGrid gets a dict it is free to modify
+    return copy.deepcopy(_build_grid_options_cached(tuple(df_pl.schema.items()), bool_editable, selection_mode))
+
+@functools.lru_cache(maxsize=32)
+def _build_grid_options_cached(schema_items: tuple, bool_editable: bool, selection_mode: str) -> dict:
+    # from_dataframe only reads column names and dtypes, so a zero-row frame of the same schema will do
+    gd = GridOptionsBuilder.from_dataframe(pl.DataFrame(schema=dict(schema_items)).to_pandas())
     gd.configure_default_column(filterable=True, sortable=True,
                                 resizable=True, floatingFilter=True)
     
     # Add row selection capability
     gd.configure_selection(selection_mode=selection_mode, use_checkbox=True)
     
-    for col, dtype in df_pl.schema.items():
+    for col, dtype in schema_items:
         if dtype == pl.Boolean:
             common = dict(
                 filter="agSetColumnFilter",
@@ -66,8 +75,8 @@ def aggrid_polars(df_pl: pl.DataFrame,
     # Create grid options with selection mode
     grid_options = build_grid_options(df_pl, bool_editable=bool_editable, selection_mode=selection_mode)
     
-    # Convert to pandas for AgGrid
-    df_pd = df_pl.to_pandas()
+    # Convert to pandas for AgGrid, once, keeping the Arrow buffers instead of copying them into NumPy
+    df_pd = df_pl.to_pandas(use_pyarrow_extension_array=True)
     
     # Create a container to maintain state across rerenders
     if f"aggrid_state_{key}" not in st.session_state:
@@ -1,8 +1,25 @@
+from typing import Optional, Tuple
 import streamlit as st
 from entity.Sheet import Spreadsheet, GoogleSheetsAdapter
 from utils.sheets_cache import sheets_cache
+from controllers.user_controller import UserController
 import time
-from model.config import get_secrets
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def user_secret_fields(user_email: str) -> Tuple[str, ...]:
+    """Comma-separated fields of the user's secrets entry (keyed by the email's local part), empty if absent"""
+    raw = st.secrets.get(user_email.split('@')[0])
+    return tuple(raw.split(',')) if raw is not None else ()
+
+def streamlit_login_state() -> Tuple[bool, Optional[str]]:
+    """(logged in through Streamlit auth, that user's email), reading the st.user proxy once"""
+    try:
+        user = st.user
+        if user is None or not getattr(user, 'is_logged_in', False):
+            return False, None
+        return True, getattr(user, 'email', None)
+    except Exception:
+        return False, None
 
 class AuthenticationController:
     """Controller handling user authentication and authorization"""
@@ -13,14 +30,8 @@ class AuthenticationController:
         self.fibro_spreadsheet = None
         
         # Initialize session state variables if they don't exist
-        if 'user_email' not in st.session_state:
-            st.session_state.user_email = None
-        if 'user_role' not in st.session_state:
-            st.session_state.user_role = None
-        if 'user_project' not in st.session_state:
-            st.session_state.user_project = None
-        if 'user_data' not in st.session_state:
-            st.session_state.user_data = None
+        for key in ('user_email', 'user_role', 'user_project', 'user_data'):
+            st.session_state.setdefault(key, None)
     
     def render_auth_ui(self):
         """Render authentication UI in the sidebar"""
@@ -28,16 +39,13 @@ class AuthenticationController:
             st.title("👤 User Access")
             
             # Check if the user is authenticated through Streamlit or in demo mode
-            try:
-                is_streamlit_logged_in = st.user is not None and hasattr(st.user, 'is_logged_in') and st.user.is_logged_in
-            except Exception:
-                is_streamlit_logged_in = False
+            is_streamlit_logged_in, streamlit_email = streamlit_login_state()
             
             is_logged_in = is_streamlit_logged_in or st.session_state.get('user_role') is not None
             
             if is_logged_in:
                 if is_streamlit_logged_in:
-                    user_email = getattr(st.user, 'email', None)
+                    user_email = streamlit_email
                     if user_email is None:
                         st.error("Could not retrieve user email. Please try logging in again.")
                         if st.button("Retry Login"):
@@ -45,8 +53,9 @@ class AuthenticationController:
                         return
                     st.write(f"Logged in as: {user_email}")
                     # Display user role information
-                    user_role = st.secrets.get(user_email.split('@')[0], 'Guest')
-                    user_project = st.secrets.get(f"{user_email.split('@')[0]}", 'None')
+                    fields = user_secret_fields(user_email)
+                    user_role = ','.join(fields) if fields else 'Guest'
+                    user_project = ','.join(fields) if fields else 'None'
                 else:
                     # For demo mode
                     st.write(f"Demo mode as: Guest")
@@ -61,9 +70,7 @@ class AuthenticationController:
                 # st.write(f"Project: {user_role.split(',')[1]}")
                 # if user_project is not None:
                 #     user_project = user_project.split(',')[1]
-                st.session_state.user_email = user_email
-                st.session_state.user_role = user_role
-                st.session_state.user_project = user_project
+                st.session_state.update(user_email=user_email, user_role=user_role, user_project=user_project)
                 
                 st.write(f"Role: {user_project}")
                 st.write(f"Project: {user_role}")
@@ -151,20 +158,14 @@ class AuthenticationController:
     
     def get_user_details(self, user_email: str) -> tuple:
         """Get user details from spreadsheet"""
-        if not self.main_spreadsheet:
-            self.get_spreadsheet()
-        
-        # Get the user sheet
+        # Get the user sheet, shared across reruns and sessions instead of re-read on every call
         try:
-            user_sheet = self.main_spreadsheet.get_sheet("user", "user")
-            users_data = user_sheet.data
+            users_data = UserController().get_user_records()
             
-            # Find user by email
-            user_data = None
-            for user in users_data:
-                if user.get('email', '').lower() == user_email.lower():
-                    user_data = user
-                    break
+            # Find user by email, lowering the target once and stopping at the first match
+            target = user_email.lower()
+            user_data = next((user for user in users_data
+                              if str(user.get('email', '')).lower() == target), None)
             
             if user_data:
                 # Extract user details
@@ -182,6 +183,68 @@ class AuthenticationController:
         
         # Default values if user not found
         return None, "Guest", "None"
+
+    def authorize_page(self,
+                       allowed_roles: Optional[Tuple[str, ...]] = None,
+                       project: Optional[str] = None,
+                       spreadsheet_key: str = 'spreadsheet',
+                       load_spreadsheet=None,
+                       demo_spreadsheet_key: str = 'demo_spreadsheet',
+                       load_demo_spreadsheet=None) -> Tuple[str, str, str, object]:
+        """
+        Shared page guard: render the sidebar auth UI, check access, and load the page's spreadsheet.
+
+        Stops the script run when the visitor may not see the page.
+
+        Args:
+            allowed_roles (tuple, optional): Roles allowed for Google-authenticated users, any role if None
+            project (str, optional): Project whose users (besides Admins) may see the page, any project if None
+            spreadsheet_key (str): Session state key caching the page's spreadsheet
+            load_spreadsheet (callable, optional): Loader for that spreadsheet, get_spreadsheet by default
+            demo_spreadsheet_key (str): Session state key caching the demo spreadsheet
+            load_demo_spreadsheet (callable, optional): Loader for the demo spreadsheet, get_demo_spreadsheet by default
+
+        Returns:
+            tuple: (user_email, user_role, user_project, spreadsheet)
+        """
+        self.render_auth_ui()
+
+        is_streamlit_logged_in, user_email = streamlit_login_state()
+
+        if is_streamlit_logged_in:
+            if user_email is None:
+                st.error("Could not retrieve user email. Please refresh and try again.")
+                st.stop()
+            # Fields of the user's secrets entry, parsed once and cached across reruns
+            fields = user_secret_fields(user_email)
+            user_project = fields[1] if len(fields) > 1 else 'None'
+            user_role = fields[0].strip() if fields else 'Guest'
+
+            if allowed_roles is not None and user_role not in allowed_roles:
+                st.warning("You don't have permission to access this page.")
+                st.stop()
+            if project is not None and user_project != project and user_role != 'Admin':
+                st.warning("You don't have permission to access this page.")
+                st.stop()
+
+            if spreadsheet_key not in st.session_state:
+                st.session_state[spreadsheet_key] = (load_spreadsheet or self.get_spreadsheet)()
+            return user_email, user_role, user_project, st.session_state.get(spreadsheet_key, None)
+
+        if st.session_state.get('user_role') is None:
+            st.warning("Please log in from the main page to access this feature.")
+            st.stop()
+
+        if st.session_state.get('user_email') != "guest@example.com":
+            st.warning("Please log in via Google or as a Guest to visit this site.")
+            st.stop()
+
+        if demo_spreadsheet_key not in st.session_state:
+            st.session_state[demo_spreadsheet_key] = (load_demo_spreadsheet or self.get_demo_spreadsheet)()
+        return (st.session_state.user_email,
+                st.session_state.user_role,
+                st.session_state.user_project,
+                st.session_state.get(demo_spreadsheet_key, None))
     
     def login_with_google(self):
         """Redirect to Google login"""
@@ -190,14 +253,16 @@ class AuthenticationController:
     
     def demo_login(self, email: str, role: str, project: str):
         """Set up a demo login with specified role and project"""
-        st.session_state.user_email = email
-        st.session_state.user_role = 'Admin'
-        st.session_state.user_project = 'Admin'
-        st.session_state.user_data = {
-            'email': email,
-            'role': 'Admin',
-            'projects': ['Admin']
-        }
+        st.session_state.update(
+            user_email=email,
+            user_role='Admin',
+            user_project='Admin',
+            user_data={
+                'email': email,
+                'role': 'Admin',
+                'projects': ['Admin']
+            }
+        )
         st.rerun()
     
     def logout_user(self):
@@ -2,7 +2,17 @@ from typing import Dict, List, Optional
 import pandas as pd
 import streamlit as st
 from entity.Sheet import Spreadsheet, GoogleSheetsAdapter
-from entity.Watch import WatchFactory
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_sheet_records(spreadsheet_key: str, sheet_name: str, sheet_type: str) -> List[Dict]:
+    """Fetch one sheet's records, shared across reruns and sessions for 5 minutes"""
+    spreadsheet = Spreadsheet(name="Fitbit Database", api_key=spreadsheet_key)
+    GoogleSheetsAdapter.connect(spreadsheet)
+    return spreadsheet.get_sheet(sheet_name, sheet_type=sheet_type).data
+
+def _fetch_project_records(spreadsheet_key: str) -> List[Dict]:
+    """Fetch the project sheet records, shared across reruns for 5 minutes"""
+    return _fetch_sheet_records(spreadsheet_key, "project", "project")
 
 class ProjectController:
     """Controller for project-related operations"""
@@ -14,38 +24,27 @@ class ProjectController:
     def get_all_projects(self) -> pd.DataFrame:
         """Get all projects from the spreadsheet"""
         try:
-            # Create Spreadsheet instance
-            spreadsheet = Spreadsheet(name="Fitbit Database", api_key=self.spreadsheet_key)
-            GoogleSheetsAdapter.connect(spreadsheet)
-            
-            # Get project sheet
-            project_sheet = spreadsheet.get_sheet("project", sheet_type="project")
-            return project_sheet.to_dataframe()
+            return pd.DataFrame(_fetch_project_records(self.spreadsheet_key))
         except Exception as e:
             print(f"Error getting projects: {e}")
             return pd.DataFrame()
     
     def get_project_by_name(self, name: str) -> Optional[Dict]:
         """Get a project by name"""
-        projects_df = self.get_all_projects()
-        if projects_df.empty:
+        try:
+            projects = _fetch_project_records(self.spreadsheet_key)
+        except Exception as e:
+            print(f"Error getting projects: {e}")
             return None
-            
-        project_data = projects_df[projects_df['name'] == name]
-        if len(project_data) > 0:
-            return project_data.iloc[0].to_dict()
-        return None
+        
+        # Stop at the first matching row instead of masking the whole frame
+        return next((project for project in projects if project.get('name') == name), None)
     
     def get_watches_for_project(self, project_name: str) -> pd.DataFrame:
         """Get watches for a specific project"""
         try:
-            # Create Spreadsheet instance
-            spreadsheet = Spreadsheet(name="Fitbit Database", api_key=self.spreadsheet_key)
-            GoogleSheetsAdapter.connect(spreadsheet)
-            
             # Get fitbit sheet
-            fitbit_sheet = spreadsheet.get_sheet("fitbit", sheet_type="fitbit")
-            fitbit_df = fitbit_sheet.to_dataframe()
+            fitbit_df = pd.DataFrame(_fetch_sheet_records(self.spreadsheet_key, "fitbit", "fitbit"))
             
             if project_name == "Admin":
                 return fitbit_df
@@ -59,13 +58,8 @@ class ProjectController:
     def get_watch_details(self, watch_name: str) -> Optional[Dict]:
         """Get detailed information about a specific watch"""
         try:
-            # Create Spreadsheet instance
-            spreadsheet = Spreadsheet(name="Fitbit Database", api_key=self.spreadsheet_key)
-            GoogleSheetsAdapter.connect(spreadsheet)
-            
             # Get fitbit sheet
-            fitbit_sheet = spreadsheet.get_sheet("fitbit", sheet_type="fitbit")
-            fitbit_df = fitbit_sheet.to_dataframe()
+            fitbit_df = pd.DataFrame(_fetch_sheet_records(self.spreadsheet_key, "fitbit", "fitbit"))
             
             # Get this watch's details
             watch_details = fitbit_df[fitbit_df['name'] == watch_name]
@@ -77,8 +71,7 @@ class ProjectController:
                 details = watch_details.iloc[0].to_dict()
                 
                 # Also get the latest log data
-                log_sheet = spreadsheet.get_sheet("FitbitLog", sheet_type="log")
-                log_df = log_sheet.to_dataframe()
+                log_df = pd.DataFrame(_fetch_sheet_records(self.spreadsheet_key, "FitbitLog", "log"))
                 
                 # Filter to this watch and get the most recent entry
                 watch_logs = log_df[log_df['watchName'] == watch_name]
@@ -107,13 +100,8 @@ class ProjectController:
     def get_watches_for_student(self, student_email: str) -> pd.DataFrame:
         """Get watches assigned to a specific student"""
         try:
-            # Create Spreadsheet instance
-            spreadsheet = Spreadsheet(name="Fitbit Database", api_key=self.spreadsheet_key)
-            GoogleSheetsAdapter.connect(spreadsheet)
-            
             # Get studentWatch sheet
-            student_watch_sheet = spreadsheet.get_sheet("studentWatch", sheet_type="generic")
-            student_watch_df = student_watch_sheet.to_dataframe()
+            student_watch_df = pd.DataFrame(_fetch_sheet_records(self.spreadsheet_key, "studentWatch", "generic"))
             
             # Filter for this student
             student_watches = student_watch_df[student_watch_df['email'] == student_email]
@@ -125,8 +113,7 @@ class ProjectController:
             watch_names = student_watches['watch'].tolist()
             
             # Get full watch details from fitbit sheet
-            fitbit_sheet = spreadsheet.get_sheet("fitbit", sheet_type="fitbit")
-            fitbit_df = fitbit_sheet.to_dataframe()
+            fitbit_df = pd.DataFrame(_fetch_sheet_records(self.spreadsheet_key, "fitbit", "fitbit"))
             
             # Filter for these watches
             return fitbit_df[fitbit_df['name'].isin(watch_names)]
@@ -2,6 +2,14 @@ from typing import Dict, List, Optional
 import pandas as pd
 from entity.Sheet import Spreadsheet, GoogleSheetsAdapter
 import streamlit as st
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_user_records(spreadsheet_key: str) -> List[Dict]:
+    """Fetch the user sheet records, shared across reruns for 5 minutes"""
+    spreadsheet = Spreadsheet(name="Fitbit Database", api_key=spreadsheet_key)
+    GoogleSheetsAdapter.connect(spreadsheet)
+    return spreadsheet.get_sheet("user", sheet_type="user").data
+
 class UserController:
     """Controller for user-related operations"""
     
@@ -9,31 +17,28 @@ class UserController:
         """Initialize the user controller"""
         self.spreadsheet_key = st.secrets.get("spreadsheet_key", "")
         
+    def get_user_records(self) -> List[Dict]:
+        """Get the user sheet records, cached across reruns and sessions for 5 minutes"""
+        return _fetch_user_records(self.spreadsheet_key)
+        
     def get_all_users(self) -> pd.DataFrame:
         """Get all users from the spreadsheet"""
         try:
-            # Create Spreadsheet instance
-            spreadsheet = Spreadsheet(name="Fitbit Database", api_key=self.spreadsheet_key)
-            GoogleSheetsAdapter.connect(spreadsheet)
-            
-            # Get user sheet
-            user_sheet = spreadsheet.get_sheet("user", sheet_type="user")
-            return user_sheet.to_dataframe()
+            return pd.DataFrame(_fetch_user_records(self.spreadsheet_key))
         except Exception as e:
             print(f"Error getting users: {e}")
             return pd.DataFrame()
     
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get a user by email"""
-        users_df = self.get_all_users()
-        # st.write(f"users df: {users_df}")
-        if users_df.empty:
+        try:
+            users = _fetch_user_records(self.spreadsheet_key)
+        except Exception as e:
+            print(f"Error getting users: {e}")
             return None
-            
-        user_data = users_df[users_df['email'] == email]
-        if len(user_data) > 0:
-            return user_data.iloc[0].to_dict()
-        return None
+        
+        # Stop at the first matching row instead of building and masking a whole frame
+        return next((user for user in users if user.get('email') == email), None)
     
     def get_users_by_role(self, role: str) -> pd.DataFrame:
         """Get users by role"""
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Set, Any, Union, Type, TYPE_CHECKING
-from collections import defaultdict
+import threading
 import uuid
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from entity.Watch import Watch, WatchAssignmentManager, WatchFactory
 from entity.Sheet import Sheet, Spreadsheet, SheetFactory
 
+def _resolve_users(user_ids) -> List[User]:
+    """Look each user ID up once, skipping IDs the repository does not know"""
+    return [user for user in map(UserRepository.get_instance().get_by_id, user_ids) if user]
+
 class ProjectStatus(str, Enum):
     """Enum for project status"""
     PLANNING = "planning"
@@ -185,24 +189,19 @@ class Project(Subject):
     
     def get_managers(self) -> List[User]:
         """Get all managers for this project"""
-        user_repo = UserRepository.get_instance()
-        return [user_repo.get_by_id(user_id) for user_id in self.managers if user_repo.get_by_id(user_id)]
+        return _resolve_users(self.managers)
     
     def get_students(self) -> List[User]:
         """Get all students for this project"""
-        user_repo = UserRepository.get_instance()
-        return [user_repo.get_by_id(user_id) for user_id in self.students if user_repo.get_by_id(user_id)]
+        return _resolve_users(self.students)
     
     def get_admins(self) -> List[User]:
         """Get all admins with access to this project"""
-        user_repo = UserRepository.get_instance()
-        return [user_repo.get_by_id(user_id) for user_id in self.admins if user_repo.get_by_id(user_id)]
+        return _resolve_users(self.admins)
     
     def get_all_users(self) -> List[User]:
         """Get all users associated with this project"""
-        user_ids = self.managers.union(self.students).union(self.admins)
-        user_repo = UserRepository.get_instance()
-        return [user_repo.get_by_id(user_id) for user_id in user_ids if user_repo.get_by_id(user_id)]
+        return _resolve_users(self.managers | self.students | self.admins)
     
     # Observer pattern implementation
     def attach(self, observer: Observer) -> None:
@@ -270,24 +269,21 @@ class ProjectFactory:
 class ProjectRepository:
     """Repository for storing and retrieving projects"""
     _instance = None
+    _init_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(ProjectRepository, cls).__new__(cls)
-            cls._instance._projects = {}
-            cls._instance._initialized = False
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = super(ProjectRepository, cls).__new__(cls)
+                    instance._projects = {}  # Dictionary of projects by ID
+                    instance._name_index = {}  # Index of projects by name
+                    instance._status_index = {}  # Index of projects by status
+                    instance._user_index = {}  # Index of projects by user ID
+                    instance._spreadsheet_index = {}  # Index of projects by spreadsheet ID
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if getattr(self, '_initialized', False):
-            return
-        self._initialized = True
-        self._projects = {}  # Dictionary of projects by ID
-        self._name_index = {}  # Index of projects by name
-        self._status_index = {}  # Index of projects by status
-        self._user_index = {}  # Index of projects by user ID
-        self._spreadsheet_index = {}  # Index of projects by spreadsheet ID
-    
     def add(self, project: Project) -> None:
         """Add a project to the repository"""
         # Store project by ID
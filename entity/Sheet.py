@@ -1,16 +1,26 @@
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any, Callable, Type, Union, Set
-from collections import defaultdict
+from typing import Optional, Dict, List, Any, Callable, Type, Union, Set, ClassVar, Tuple
 import pandas as pd
 import polars as pl
 from abc import ABC, abstractmethod
 import datetime
+import functools
+import io
+import logging
+import operator
 import os
+import random
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from pathlib import Path
 import gspread
 from google.oauth2.service_account import Credentials
 import uuid
 import streamlit as st
-from entity.Watch import Watch, WatchFactory  # Remove FitbitAPI as it doesn't exist
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from entity.Watch import Watch, WatchFactory, map_watches  # Remove FitbitAPI as it doesn't exist
 import traceback  # Add import for traceback
 from utils.sheets_cache import sheets_cache  # Import sheets_cache
 
@@ -26,6 +36,9 @@ except ImportError:
             # Return empty dict if neither is available
             return {"gcp_service_account": {}, "spreadsheet_key": ""}
 
+# Per-watch progress goes to debug logging, so concurrent refreshes do not contend on stdout
+logger = logging.getLogger(__name__)
+
 # =====================================================================
 # ==================== ENTITY LAYER SHEET CLASSES =====================
 # =====================================================================
@@ -181,6 +194,98 @@ class LogSheet(Sheet):
     ))
 
 
+# Column order and dtypes of a Fitbit log entry (CSV file, "log" and "FitbitLog" sheets)
+FITBIT_LOG_SCHEMA = {
+    "project": pl.Utf8, "watchName": pl.Utf8, "lastCheck": pl.Utf8, "lastSynced": pl.Utf8,
+    "lastBattary": pl.Utf8, "lastHR": pl.Utf8, "lastSleepStartDateTime": pl.Utf8,
+    "lastSleepEndDateTime": pl.Utf8, "lastSteps": pl.Utf8, "lastBattaryVal": pl.Utf8,
+    "lastHRVal": pl.Utf8, "lastHRSeq": pl.Utf8, "lastSleepDur": pl.Utf8, "lastStepsVal": pl.Utf8,
+    "CurrentFailedSync": pl.Int64, "TotalFailedSync": pl.Int64,
+    "CurrentFailedHR": pl.Int64, "TotalFailedHR": pl.Int64,
+    "CurrentFailedSleep": pl.Int64, "TotalFailedSleep": pl.Int64,
+    "CurrentFailedSteps": pl.Int64, "TotalFailedSteps": pl.Int64,
+    "CurrentFailedBattary": pl.Int64, "TotalFailedBattary": pl.Int64,
+    "ID": pl.Utf8,
+}
+
+
+def _latest_entries_by_id(log_df: pl.DataFrame) -> Dict[Any, dict]:
+    """Map each watch ID to its most recent log entry (by lastCheck) in one sort + unique pass"""
+    if log_df.is_empty() or "ID" not in log_df.columns:
+        return {}
+    if "lastCheck" in log_df.columns:
+        log_df = log_df.sort("lastCheck", descending=True)
+    latest = log_df.unique(subset="ID", keep="first", maintain_order=True)
+    return {entry["ID"]: entry for entry in latest.iter_rows(named=True)}
+
+
+
+def _conform_log(log_df: pl.DataFrame) -> pl.DataFrame:
+    """Cast a log frame to FITBIT_LOG_SCHEMA, adding missing columns as nulls and dropping unknown ones"""
+    return log_df.select([
+        (pl.col(col) if col in log_df.columns else pl.lit(None)).cast(dtype, strict=False).alias(col)
+        for col, dtype in FITBIT_LOG_SCHEMA.items()
+    ])
+
+# Data types tracked by the Current/Total failure counters of a log entry
+FAILURE_KINDS = ("Sync", "HR", "Sleep", "Steps", "Battary")
+
+# Fitbit data columns a log check reads from each watch row
+CHECK_SOURCE_COLUMNS = ("project", "name", "syncDate", "sleep_start", "sleep_end",
+                        "battery", "HR", "sleep_duration", "steps")
+
+
+# Fitbit data column whose value decides each FAILURE_KINDS check
+CHECK_FLAG_COLUMNS = (("Sync", "syncDate"), ("HR", "HR"), ("Sleep", "sleep_start"),
+                      ("Steps", "steps"), ("Battary", "battery"))
+
+
+def _check_flags(row: dict) -> Dict[str, bool]:
+    """
+    Per-kind success flags of one watch check, keyed ok<Kind>.
+    
+    A check passes when bool(value) holds on the raw reading, so a missing value, ""
+    and a 0 reading all count as failures. Taken before the values are stringified,
+    since "0" would otherwise pass.
+    """
+    return {f"ok{kind}": bool(row.get(column)) for kind, column in CHECK_FLAG_COLUMNS}
+
+
+def _apply_failure_counters(checks: pl.DataFrame, previous: pl.DataFrame, reset_watches: Set[str]) -> pl.DataFrame:
+    """
+    Add the Current/Total failure counters to this run's checks in one vectorized pass.
+    
+    checks holds one row per watch with an ID column and a boolean ok<Kind> column per
+    FAILURE_KINDS entry; previous holds each watch's last log entry. A success resets the
+    current counter, a failure increments both, and watches in reset_watches start their
+    totals from zero.
+    """
+    counter_columns = [f"{prefix}Failed{kind}" for kind in FAILURE_KINDS for prefix in ("Current", "Total")]
+    previous_df = (
+        _conform_log(previous)
+        .select(["ID", *counter_columns])
+        .unique(subset="ID", keep="last", maintain_order=True)
+        .with_columns(pl.col(counter_columns).fill_null(0))
+    )
+    
+    # A typed Series lets Polars hash the reset IDs natively instead of converting a Python list
+    reset = pl.col("ID").is_in(pl.Series("ID", list(reset_watches), dtype=pl.Utf8))
+    counters = []
+    for kind in FAILURE_KINDS:
+        failed = (~pl.col(f"ok{kind}")).cast(pl.Int64)
+        current, total = pl.col(f"CurrentFailed{kind}").fill_null(0), pl.col(f"TotalFailed{kind}").fill_null(0)
+        counters.append(pl.when(pl.col(f"ok{kind}")).then(0).otherwise(current + 1).alias(f"CurrentFailed{kind}"))
+        counters.append((pl.when(reset).then(0).otherwise(total) + failed).alias(f"TotalFailed{kind}"))
+    
+    return (
+        checks.with_row_index("_order")
+        .join(previous_df, on="ID", how="left")
+        .sort("_order")
+        .with_columns(counters)
+        .drop("_order")
+    )
+
+
 @dataclass
 class BulldogSheet(Sheet):
     """Sheet for storing bulldog data"""
@@ -333,24 +438,152 @@ class Spreadsheet:
 # ==================== GOOGLE SHEETS API LAYER ========================
 # =====================================================================
 
+def _fill_gaps(values: List[List[str]]) -> List[List[str]]:
+    """Pad ragged rows (the values API trims trailing blanks) to a rectangle"""
+    width = max((len(row) for row in values), default=0)
+    return [row + [''] * (width - len(row)) for row in values]
+
+
+def _unique_headers(headers: List[str]) -> List[str]:
+    """Suffix repeated header names (name, name_1, ...) so records keep every column"""
+    unique_headers = []
+    seen = {}
+    for h in headers:
+        if h in seen:
+            seen[h] += 1
+            unique_headers.append(f"{h}_{seen[h]}")
+        else:
+            seen[h] = 0
+            unique_headers.append(h)
+    return unique_headers
+
+
+def _records_from_values(values: List[List[str]]) -> List[dict]:
+    """Build get_all_records-style dicts from a header row plus raw values"""
+    if not values:
+        return []
+    headers = tuple(values[0])
+    return [dict(zip(headers, gspread.utils.numericise_all(row))) for row in values[1:]]
+
+
+# Sheets API statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_ATTEMPTS = 7
+RETRY_MAX_DELAY = 64  # seconds
+
+
+def _with_retry(fn: Callable, *args, **kwargs):
+    """
+    Call a gspread method, retrying rate-limit and 5xx errors.
+    
+    Honors the Retry-After header when the API sends one, otherwise backs off
+    exponentially with jitter as the Sheets usage limits docs recommend.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            response = getattr(e, 'response', None)
+            status = getattr(response, 'status_code', None)
+            if status not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+                raise
+            try:
+                delay = int(response.headers.get("Retry-After", 0))
+            except (TypeError, ValueError):
+                delay = 0
+            delay = delay or min(RETRY_MAX_DELAY, 2 ** attempt + random.random())
+            print(f"Sheets API returned {status}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+CSV_EXPORT_URL = "https://docs.google.com/spreadsheets/d/{key}/export?format=csv&gid={gid}"
+
+
+def _export_csv_values(client, spreadsheet_key: str, worksheet) -> List[List[str]]:
+    """Read a worksheet's raw values through the CSV export endpoint instead of the JSON values API"""
+    # gspread 6 keeps the authorized session on http_client, older releases on the client itself
+    session = getattr(client, 'http_client', client).session
+    response = session.get(CSV_EXPORT_URL.format(key=spreadsheet_key, gid=worksheet.id))
+    response.raise_for_status()
+    if not response.content:
+        return []
+    frame = pl.read_csv(io.BytesIO(response.content), has_header=False, infer_schema_length=0)
+    return [list(row) for row in frame.fill_null("").rows()]
+
+
+# On-disk snapshots of batched worksheet reads, shared by every Streamlit/cron process
+SNAPSHOT_DIR = Path(tempfile.gettempdir())
+SNAPSHOT_TTL = 300  # seconds
+
+
+def _snapshot_path(spreadsheet_key: str, index: int) -> Path:
+    return SNAPSHOT_DIR / f"fbm_sheets_{spreadsheet_key}_{index}.parquet"
+
+
+def _load_snapshot(spreadsheet_key: str, count: int) -> Optional[List[List[List[str]]]]:
+    """Load worksheet value grids from disk if every snapshot is younger than SNAPSHOT_TTL"""
+    paths = [_snapshot_path(spreadsheet_key, index) for index in range(count)]
+    try:
+        if not all(path.exists() and time.time() - path.stat().st_mtime < SNAPSHOT_TTL for path in paths):
+            return None
+        return [[list(row) for row in pl.read_parquet(path).rows()] for path in paths]
+    except Exception as e:
+        print(f"Error reading sheet snapshot: {e}")
+        return None
+
+
+def _save_snapshot(spreadsheet_key: str, grids: List[List[List[str]]]) -> None:
+    """Write worksheet value grids to disk as zstd-compressed Parquet"""
+    try:
+        for index, values in enumerate(grids):
+            width = len(values[0]) if values else 0
+            df = pl.DataFrame(values, schema=[(f"c{i}", pl.Utf8) for i in range(width)], orient="row")
+            path = _snapshot_path(spreadsheet_key, index)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            df.write_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error writing sheet snapshot: {e}")
+
+
+def _clear_snapshot(spreadsheet_key: str, count: int) -> None:
+    for index in range(count):
+        _snapshot_path(spreadsheet_key, index).unlink(missing_ok=True)
+
+
+def _worksheet_records(worksheet) -> List[dict]:
+    """Read a worksheet with a single get_all_values call and build records locally"""
+    return _records_from_values(_with_retry(worksheet.get_all_values))
+
+
+@st.cache_data(ttl=SNAPSHOT_TTL, show_spinner=False)
+def _connect_values(spreadsheet_key: str, sheet_name: str, _worksheet) -> List[List[str]]:
+    """Raw values of one worksheet read by GoogleSheetsAdapter.connect, shared across sessions and reruns"""
+    # Large history sheets are cheaper to pull as CSV than as JSON cell values
+    if sheet_name in GoogleSheetsAdapter.CSV_EXPORT_SHEETS:
+        try:
+            return _export_csv_values(SheetsAPI.get_instance().client, spreadsheet_key, _worksheet)
+        except Exception as e:
+            print(f"CSV export failed for {sheet_name}, falling back to get_all_values: {e}")
+    return _with_retry(_worksheet.get_all_values)
+
+
 class SheetsAPI:
     """Singleton class for accessing the Google Sheets API"""
     _instance = None
+    _init_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(SheetsAPI, cls).__new__(cls)
-            cls._instance._initialized = False
+            # Concurrent first renders must not both authorize a client
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = super(SheetsAPI, cls).__new__(cls)
+                    instance.client = cls._get_client()
+                    instance._spreadsheets = {}
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if getattr(self, '_initialized', False):
-            return
-            
-        self._initialized = True
-        self.client = self._get_client()
-        self._spreadsheets = {}
-    
     @staticmethod
     @st.cache_resource
     def _get_client():
@@ -383,9 +616,37 @@ class SheetsAPI:
         return cls._instance
 
 
+# Sheet type of a worksheet: the first rule whose substring occurs in its lower-cased name, in priority order
+SHEET_TYPE_RULES = (
+    ("user", "user"),
+    ("project", "project"),
+    ("fitbit", "fitbit"),
+    ("log", "log"),
+    ("qualtrics", "EMA"),
+    ("late_nums", "late_nums"),
+    ("suspicious_nums", "suspicious_nums"),
+    ("fibroema", "fibroEMA"),
+    ("for_analysis", "for_analysis"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _sheet_type_for(sheet_name: str) -> str:
+    """Determine a worksheet's sheet type from its name"""
+    if sheet_name == 'bulldog':
+        return 'bulldog'
+    lowered = sheet_name.lower()
+    return next((sheet_type for needle, sheet_type in SHEET_TYPE_RULES if needle in lowered), 'generic')
+
+
 class GoogleSheetsAdapter:
     """Adapter for connecting entity layer Spreadsheet with Google Sheets API"""
     
+    # Worksheet reads issued concurrently by connect()
+    CONNECT_WORKERS = 4
+    # Append-only history sheets read through the CSV export endpoint by connect()
+    CSV_EXPORT_SHEETS = {"FitbitLog"}
+    
     @staticmethod
     def get_all_reords(spreadsheet: Spreadsheet, name: str) -> Sheet:
         """Get a sheet by name from the entity layer"""
@@ -393,7 +654,7 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheets_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            records = worksheet.get_all_records()
+            records = _worksheet_records(worksheet)
         except gspread.exceptions.WorksheetNotFound:
             print(f"Worksheet {name} not found in spreadsheet {spreadsheet.name}")
             records = []
@@ -406,7 +667,7 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheet_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            records = worksheet.get_all_records()
+            records = _worksheet_records(worksheet)
             for record in records:
                 if all(record.get(key) == row[key] for key in keys):
                     return record
@@ -420,7 +681,7 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheet_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            records = worksheet.get_all_records()
+            records = _worksheet_records(worksheet)
             result = []
             for record in records:
                 if all(record.get(key) == row[key] for key in keys):
@@ -437,7 +698,7 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheet_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            records = worksheet.get_all_records()
+            records = _worksheet_records(worksheet)
             for record in records:
                 if all(record.get(key) == on[key] for key in on):
                     # Update the record with new values
@@ -457,7 +718,7 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheet_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            records = worksheet.get_all_records()
+            records = _worksheet_records(worksheet)
             for record in records:
                 if all(record.get(key) == on[key] for key in on):
                     # Update the record with new values
@@ -478,8 +739,8 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheet_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            for record in data:
-                worksheet.append_row(list(record.values()))
+            if data:
+                _with_retry(worksheet.append_rows, [list(record.values()) for record in data])
         except gspread.exceptions.WorksheetNotFound:
             print(f"Worksheet {name} not found in spreadsheet {spreadsheet.name}")
             return None
@@ -496,7 +757,7 @@ class GoogleSheetsAdapter:
         google_spreadsheet = sheet_api.open_spreadsheet(spreadsheet.api_key)
         try:
             worksheet = google_spreadsheet.worksheet(name)
-            records = worksheet.get_all_records()
+            records = _worksheet_records(worksheet)
             for record in records:
                 if all(record.get(key) == on[key] for key in on):
                     # Delete the row
@@ -523,25 +784,35 @@ class GoogleSheetsAdapter:
         # Use the client to fetch the actual spreadsheet
         google_spreadsheet = sheets_api.open_spreadsheet(spreadsheet.api_key)
         
-        # Map worksheets to Sheet objects
-        for worksheet in google_spreadsheet.worksheets():
+        # White list of sheet names
+        sheets_names = [
+            "user", "project", "fitbit", "log", "bulldog", "EMA", "FitbitLog",
+            "fitbit_alerts_config", "qualtrics_alerts_config", "late_nums", "suspicious_nums",
+            "EMA", "student_fitbit", "chats", "for_analysis", "appsheet_alerts_config"
+        ]
+        worksheets = []
+        for worksheet in _with_retry(google_spreadsheet.worksheets):
             sheet_name = worksheet.title
             if r'שליחה לרשימת תפוצה' in sheet_name:
                 sheet_name = 'bulldog'
-            # White list of sheet names
-            sheets_names = [
-                "user", "project", "fitbit", "log", "bulldog", "EMA", "FitbitLog",
-                "fitbit_alerts_config", "qualtrics_alerts_config", "late_nums", "suspicious_nums",
-                "EMA", "student_fitbit", "chats", "for_analysis", "appsheet_alerts_config"
-            ]
-            if sheet_name not in sheets_names:
-                continue
-                
+            if sheet_name in sheets_names:
+                worksheets.append((sheet_name, worksheet))
+        
+        # Each uncached read is a blocking HTTPS request, so overlap them instead of paying for them one by one.
+        # The workers share the calling script's run context, so _connect_values caches as it does on the script thread
+        with ThreadPoolExecutor(max_workers=GoogleSheetsAdapter.CONNECT_WORKERS,
+                                initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as pool:
+            pending = [pool.submit(_connect_values, spreadsheet.api_key, sheet_name, worksheet)
+                       for sheet_name, worksheet in worksheets]
+        
+        # Map worksheets to Sheet objects
+        for (sheet_name, worksheet), future in zip(worksheets, pending):
             try:
                 # For bulldog sheet with duplicate headers, use a custom extraction
                 if sheet_name == 'bulldog':
                     # Get all values including headers
-                    all_values = worksheet.get_all_values()
+                    all_values = future.result()
                     if len(all_values) > 0:
                         # Get the first 5 columns only
                         headers = all_values[0][:5]
@@ -553,68 +824,17 @@ class GoogleSheetsAdapter:
                                         for i in range(len(headers))}
                                 records.append(record)
                 else:
-                    # For other sheets, try the normal approach
-                    records = worksheet.get_all_records()
+                    # For other sheets, read raw values once and build records locally,
+                    # de-duplicating any repeated header names
+                    all_values = future.result()
+                    if all_values:
+                        all_values[0] = _unique_headers(all_values[0])
+                    records = _records_from_values(all_values)
             except Exception as e:
                 print(f"Error getting records from {sheet_name}: {e}")
-                # Fallback for any sheet with problematic headers
-                try:
-                    all_values = worksheet.get_all_values()
-                    if len(all_values) > 0:
-                        headers = all_values[0]
-                        # Create unique headers
-                        unique_headers = []
-                        seen = {}
-                        for h in headers:
-                            if h in seen:
-                                seen[h] += 1
-                                unique_headers.append(f"{h}_{seen[h]}")
-                            else:
-                                seen[h] = 0
-                                unique_headers.append(h)
-                        
-                        # Get records with unique headers
-                        records = worksheet.get_all_records(expected_headers=unique_headers)
-                    else:
-                        records = []
-                except Exception as e2:
-                    print(f"Fallback also failed for {sheet_name}: {e2}")
-                    records = []
+                records = []
             
-            # Determine sheet type based on content or name
-            sheet_type = 'generic'
-            if 'user' in sheet_name.lower():
-                sheet_type = 'user'
-            elif 'project' in sheet_name.lower():
-                sheet_type = 'project'
-            elif 'fitbit' in sheet_name.lower():
-                sheet_type = 'fitbit'
-            elif 'log' in sheet_name.lower():
-                sheet_type = 'log'
-            elif sheet_name == 'bulldog':
-                sheet_type = 'bulldog'
-            elif 'qualtrics' in sheet_name.lower():
-                sheet_type = 'EMA'
-            elif 'fitbitlog' in sheet_name.lower():
-                sheet_type = 'log'
-            elif 'fitbit_alerts_config' in sheet_name.lower():
-                sheet_type = 'fitbit_alerts_config'
-            elif 'qualtrics_alert_config' in sheet_name.lower():
-                sheet_type = 'qualtrics_alert_config'
-            elif 'late_nums' in sheet_name.lower():
-                sheet_type = 'late_nums'
-            elif 'suspicious_nums' in sheet_name.lower():
-                sheet_type = 'suspicious_nums'
-            elif 'student_fitbit' in sheet_name.lower():
-                sheet_type = 'student_fitbit'
-            elif 'EMA' in sheet_name.lower():
-                sheet_type = 'EMA'
-            elif 'qualtrics_nova' in sheet_name.lower():
-                sheet_type = 'EMA'
-            elif 'fibroema' in sheet_name.lower():
-                sheet_type = 'fibroEMA'
-            elif 'for_analysis' in sheet_name.lower():
-                sheet_type = 'for_analysis'
+            sheet_type = _sheet_type_for(sheet_name)
             
             # Create and populate the sheet
             sheet = SheetFactory.create_sheet(sheet_type, sheet_name)
@@ -633,8 +853,37 @@ class GoogleSheetsAdapter:
         # Implementation for fetching worksheet data
         pass
     
+    @staticmethod
+    def _write_values(google_spreadsheet, worksheet, rows: List[list]) -> None:
+        """Write rows starting at A1 of worksheet with a single values.update request"""
+        _with_retry(
+            google_spreadsheet.values_update,
+            f"'{worksheet.title}'!A1",
+            params={'valueInputOption': 'RAW'},
+            body={'values': rows}
+        )
+    
     @staticmethod
     def save(spreadsheet: Spreadsheet, sheet_name: str = None, mode: str = 'auto'):
+        """
+        Save changes back to Google Sheets and drop cached reads of the same spreadsheet.
+        
+        Args:
+            spreadsheet: Spreadsheet entity to save
+            sheet_name: Optional specific sheet to save
+            mode: Save mode - 'auto', 'append', 'rewrite' or 'update' (see _save)
+        """
+        try:
+            return GoogleSheetsAdapter._save(spreadsheet, sheet_name, mode)
+        finally:
+            # Readers on other sessions should see the write instead of a cached copy
+            _connect_values.clear()
+            manager = LegacySpreadsheetManager._instance
+            if manager is not None and manager._spreadsheet_key == spreadsheet.api_key:
+                LegacySpreadsheetManager.clear_cache()
+    
+    @staticmethod
+    def _save(spreadsheet: Spreadsheet, sheet_name: str = None, mode: str = 'auto'):
         """
         Save changes back to Google Sheets.
         
@@ -686,12 +935,7 @@ class GoogleSheetsAdapter:
                         if save_mode == 'rewrite':
                             # Full rewrite - clear and add all data
                             print(f"Using REWRITE strategy for {sheet_name}")
-                            worksheet.clear()
-                            worksheet.append_row(headers)
-                            
-                            # Add all rows in batches for better performance
-                            batch_size = 100  # Google Sheets allows up to 100 rows in a batch
-                            all_rows = []
+                            all_rows = [headers]
                             i = 0
                             for item in sheet.data:
                                 if isinstance(item, list):
@@ -700,11 +944,10 @@ class GoogleSheetsAdapter:
                                 row = [item.get(header, '') for header in headers]
                                 all_rows.append(row)
                             
-                            # Send in batches
-                            for i in range(0, len(all_rows), batch_size):
-                                batch = all_rows[i:i+batch_size]
-                                worksheet.append_rows(batch)
-                                print(f"Saved batch {i//batch_size + 1}/{(len(all_rows)-1)//batch_size + 1}")
+                            # Clear, then write headers and all rows in a single values request
+                            _with_retry(worksheet.clear)
+                            GoogleSheetsAdapter._write_values(google_spreadsheet, worksheet, all_rows)
+                            print(f"Saved {len(all_rows) - 1} rows")
                         
                         elif save_mode == 'append':
                             # Append-only strategy - add only new records
@@ -717,10 +960,10 @@ class GoogleSheetsAdapter:
                                 print(f"Headers mismatch in {sheet_name}: existing={existing_headers}, new={headers}")
                                 
                                 # Check if this is a new sheet with no data
-                                all_values = worksheet.get_all_values()
+                                all_values = _with_retry(worksheet.get_all_values)
                                 if len(all_values) <= 1:  # Only header row or empty
                                     # Rewrite headers for new/empty sheet
-                                    worksheet.clear()
+                                    _with_retry(worksheet.clear)
                                     worksheet.append_row(headers)
                                 else:
                                     # For existing data with schema change, fall back to rewrite
@@ -735,31 +978,17 @@ class GoogleSheetsAdapter:
                                 # For FitbitLog, we know we just want to append all data
                                 # Find the last row with data
                                 try:
-                                    last_row = len(worksheet.get_all_values())
-                                    if last_row <= 1:  # Only header or empty
-                                        start_row = 1  # Start after header
-                                    else:
-                                        start_row = last_row
-                                        
-                                    # Add all new rows
-                                    batch_size = 100
-                                    all_rows = []
-                                    
-                                    for item in sheet.data:
-                                        row = [item.get(header, '') for header in headers]
-                                        all_rows.append(row)
-                                    
-                                    # Send in batches
-                                    for i in range(0, len(all_rows), batch_size):
-                                        batch = all_rows[i:i+batch_size]
-                                        worksheet.append_rows(batch)
-                                        print(f"Appended batch {i//batch_size + 1}/{(len(all_rows)-1)//batch_size + 1}")
+                                    # The append endpoint finds the last row itself, so no read is needed
+                                    all_rows = [[item.get(header, '') for header in headers] for item in sheet.data]
+                                    if all_rows:
+                                        _with_retry(worksheet.append_rows, all_rows)
+                                        print(f"Appended {len(all_rows)} rows")
                                 except Exception as e:
                                     print(f"Error during append: {e}")
                                     print(traceback.format_exc())
                             else:
                                 # For other sheets, check what's already there and only add new
-                                existing_data = worksheet.get_all_records()
+                                existing_data = _worksheet_records(worksheet)
                                 
                                 # Find records that don't exist yet
                                 # Use a simple hash-based approach for comparison
@@ -783,20 +1012,11 @@ class GoogleSheetsAdapter:
                                 
                                 print(f"Found {len(new_records)} new records to append")
                                 
-                                # Add new records in batches
+                                # Add all new records with a single values.append request
                                 if new_records:
-                                    batch_size = 100
-                                    all_rows = []
-                                    
-                                    for item in new_records:
-                                        row = [item.get(header, '') for header in headers]
-                                        all_rows.append(row)
-                                    
-                                    # Send in batches
-                                    for i in range(0, len(all_rows), batch_size):
-                                        batch = all_rows[i:i+batch_size]
-                                        worksheet.append_rows(batch)
-                                        print(f"Appended batch {i//batch_size + 1}/{(len(all_rows)-1)//batch_size + 1}")
+                                    all_rows = [[item.get(header, '') for header in headers] for item in new_records]
+                                    _with_retry(worksheet.append_rows, all_rows)
+                                    print(f"Appended {len(all_rows)} rows")
                         
                         elif save_mode == 'update':
                             # Update strategy - update existing records and add new ones
@@ -804,25 +1024,13 @@ class GoogleSheetsAdapter:
                             
                             # Get all existing data
                             try:
-                                existing_data = worksheet.get_all_records()
+                                existing_data = _worksheet_records(worksheet)
                                 
                                 if not existing_data:
-                                    # Sheet exists but is empty, just write all data
-                                    worksheet.append_row(headers)
-                                    
-                                    # Add all rows in batches
-                                    batch_size = 100
-                                    all_rows = []
-                                    
-                                    for item in sheet.data:
-                                        row = [item.get(header, '') for header in headers]
-                                        all_rows.append(row)
-                                    
-                                    # Send in batches
-                                    for i in range(0, len(all_rows), batch_size):
-                                        batch = all_rows[i:i+batch_size]
-                                        worksheet.append_rows(batch)
-                                        print(f"Saved batch {i//batch_size + 1}/{(len(all_rows)-1)//batch_size + 1}")
+                                    # Sheet exists but is empty, just write headers and all data in one request
+                                    all_rows = [headers] + [[item.get(header, '') for header in headers] for item in sheet.data]
+                                    GoogleSheetsAdapter._write_values(google_spreadsheet, worksheet, all_rows)
+                                    print(f"Saved {len(all_rows) - 1} rows")
                                 else:
                                     # Determine primary key field(s) based on sheet type
                                     id_fields = ['id']  # Default - use 'id' as primary key
@@ -898,18 +1106,9 @@ class GoogleSheetsAdapter:
                                     if to_add:
                                         print(f"Adding {len(to_add)} new records")
                                         
-                                        # Prepare data for batch append
-                                        all_rows = []
-                                        for item in to_add:
-                                            row = [item.get(header, '') for header in headers]
-                                            all_rows.append(row)
-                                        
-                                        # Send in batches
-                                        batch_size = 100
-                                        for i in range(0, len(all_rows), batch_size):
-                                            batch = all_rows[i:i+batch_size]
-                                            worksheet.append_rows(batch)
-                                            print(f"Appended batch {i//batch_size + 1}/{(len(all_rows)-1)//batch_size + 1}")
+                                        # Send every new row with a single values.append request
+                                        all_rows = [[item.get(header, '') for header in headers] for item in to_add]
+                                        _with_retry(worksheet.append_rows, all_rows)
                                     
                                     if not to_update and not to_add:
                                         print(f"No changes detected for sheet {sheet_name}")
@@ -931,22 +1130,11 @@ class GoogleSheetsAdapter:
                         # Initialize new worksheet
                         if sheet.data and isinstance(sheet.data, list) and sheet.data:
                             headers = list(sheet.data[0].keys())
-                            worksheet.append_row(headers)
                             
-                            # Prepare data for batch update
-                            rows = []
-                            for item in sheet.data:
-                                row = [item.get(header, '') for header in headers]
-                                rows.append(row)
-                            
-                            # Use batch update for efficiency
-                            if rows:
-                                # Send in batches
-                                batch_size = 100
-                                for i in range(0, len(rows), batch_size):
-                                    batch = rows[i:i+batch_size]
-                                    worksheet.append_rows(batch)
-                                    print(f"Saved batch {i//batch_size + 1}/{(len(rows)-1)//batch_size + 1}")
+                            # Write headers and all rows in a single request
+                            rows = [headers] + [[item.get(header, '') for header in headers] for item in sheet.data]
+                            GoogleSheetsAdapter._write_values(google_spreadsheet, worksheet, rows)
+                            print(f"Saved {len(rows) - 1} rows")
                     
                 except Exception as e:
                     print(f"Error saving sheet {sheet_name}: {e}")
@@ -987,25 +1175,44 @@ class GoogleSheetsAdapter:
 # ================ LEGACY COMPATIBILITY LAYER ========================
 # =====================================================================
 
+# Column order of worksheet 3 rows, with a C-level getter for rows that carry every column
+WORKSHEET_3_COLUMNS = (
+    "project", "watchName", "lastCheck", "lastSynced", "lastBattary",
+    "lastHR", "lastSleepStartDateTime", "lastSleepEndDateTime", "lastSteps",
+    "lastBattaryVal", "lastHRVal", "lastHRSeq", "lastSleepDur", "lastStepsVal",
+    "CurrentFailedSync", "TotalFailedSync", "CurrentFailedHR", "TotalFailedHR",
+    "CurrentFailedSleep", "TotalFailedSleep", "CurrentFailedSteps", "TotalFailedSteps", "ID"
+)
+_worksheet_3_row = operator.itemgetter(*WORKSHEET_3_COLUMNS)
+
+
+def _worksheet_3_values(item: dict) -> List[str]:
+    """Cell values of one worksheet 3 row, blank for any column the item lacks"""
+    try:
+        values = _worksheet_3_row(item)
+    except KeyError:
+        # Only incomplete rows pay for the per-column lookups with defaults
+        values = tuple(item.get(column, '') for column in WORKSHEET_3_COLUMNS)
+    return list(map(str, values))
+
+
 class LegacySpreadsheetManager:
     """Singleton class for maintaining legacy compatibility with Spreadsheet_io.sheets"""
     _instance = None
+    _init_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(LegacySpreadsheetManager, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = super(LegacySpreadsheetManager, cls).__new__(cls)
+                    instance.sheets_api = SheetsAPI.get_instance()
+                    instance._spreadsheet_key = get_secrets().get("spreadsheet_key", "")
+                    instance._spreadsheet = None
+                    instance._worksheets = None
+                    instance._entity_spreadsheet = None
+                    cls._instance = instance
         return cls._instance
-    
-    def __init__(self):
-        if getattr(self, '_initialized', False):
-            return
-            
-        self._initialized = True
-        self.sheets_api = SheetsAPI.get_instance()
-        self._spreadsheet_key = get_secrets().get("spreadsheet_key", "")
-        self._spreadsheet = None
-        self._entity_spreadsheet = None
         
     def get_spreadsheet(self):
         """Get the Google Spreadsheet object"""
@@ -1023,8 +1230,17 @@ class LegacySpreadsheetManager:
             GoogleSheetsAdapter.connect(self._entity_spreadsheet)
         return self._entity_spreadsheet
     
+    def get_worksheets(self):
+        """Get all worksheet handles, fetched once with a single metadata request"""
+        if self._worksheets is None:
+            self._worksheets = _with_retry(self.get_spreadsheet().worksheets)
+        return self._worksheets
+    
     def get_worksheet(self, index):
         """Get a worksheet by index"""
+        worksheets = self.get_worksheets()
+        if index < len(worksheets):
+            return worksheets[index]
         return self.get_spreadsheet().get_worksheet(index)
     
     def get_worksheet_by_name(self, name):
@@ -1034,9 +1250,71 @@ class LegacySpreadsheetManager:
         except gspread.exceptions.WorksheetNotFound:
             return None
     
+    # Number of leading worksheets (users, projects, fitbits, log) read in one batch
+    PREFETCH_WORKSHEETS = 4
+    
+    @staticmethod
+    @st.cache_data(ttl=300, show_spinner=False)
+    def _fetch_all_values():
+        """Fetch the leading worksheets in a single values_batch_get request, cached for 5 minutes"""
+        manager = LegacySpreadsheetManager.get_instance()
+        count = LegacySpreadsheetManager.PREFETCH_WORKSHEETS
+        
+        # A fresh snapshot written by another process avoids the round-trip entirely
+        grids = _load_snapshot(manager._spreadsheet_key, count)
+        if grids is not None:
+            return grids
+        
+        spreadsheet = manager.get_spreadsheet()
+        worksheets = manager.get_worksheets()[:count]
+        response = _with_retry(spreadsheet.values_batch_get, [f"'{worksheet.title}'" for worksheet in worksheets])
+        grids = [_fill_gaps(value_range.get('values', [])) for value_range in response.get('valueRanges', [])]
+        if len(grids) == count:
+            _save_snapshot(manager._spreadsheet_key, grids)
+        return grids
+    
+    @staticmethod
+    @st.cache_data(ttl=300, show_spinner=False)
+    def _fetch_records(index):
+        """Fetch all records from a worksheet by index, cached for 5 minutes"""
+        return _records_from_values(LegacySpreadsheetManager._fetch_values(index))
+    
+    @staticmethod
+    @st.cache_data(ttl=300, show_spinner=False)
+    def _fetch_values(index):
+        """Fetch all raw values from a worksheet by index, cached for 5 minutes"""
+        if index < LegacySpreadsheetManager.PREFETCH_WORKSHEETS:
+            batch = LegacySpreadsheetManager._fetch_all_values()
+            if index < len(batch):
+                return batch[index]
+        return _with_retry(LegacySpreadsheetManager.get_instance().get_worksheet(index).get_all_values)
+    
+    @staticmethod
+    @st.cache_data(ttl=300, show_spinner=False)
+    def _fetch_frame(index) -> pl.DataFrame:
+        """Fetch a worksheet by index as a Polars frame of its raw string values, cached for 5 minutes"""
+        values = LegacySpreadsheetManager._fetch_values(index)
+        if not values:
+            return pl.DataFrame()
+        return pl.DataFrame(values[1:], schema=_unique_headers(values[0]), orient="row")
+    
+    @classmethod
+    def prefetch_all(cls):
+        """Warm the cache for all leading worksheets with one API request"""
+        cls._fetch_all_values()
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop cached worksheet reads so the next call hits Google Sheets"""
+        cls._fetch_all_values.clear()
+        cls._fetch_records.clear()
+        cls._fetch_values.clear()
+        cls._fetch_frame.clear()
+        _clear_snapshot(cls.get_instance()._spreadsheet_key, cls.PREFETCH_WORKSHEETS)
+    
     def get_all_records(self, index):
         """Get all records from a worksheet by index"""
-        return self.get_worksheet(index).get_all_records()
+        return self._fetch_records(index)
     
     def get_user_details(self):
         """Get user details from the first worksheet"""
@@ -1052,7 +1330,28 @@ class LegacySpreadsheetManager:
     
     def get_fitbits_log(self):
         """Get fitbit log from the fourth worksheet"""
-        return self.get_worksheet(3).get_all_values()
+        return self._fetch_values(3)
+    
+    def get_all_sheets(self) -> Tuple[List[dict], List[dict], List[dict], List[List[str]]]:
+        """Get users, projects, fitbits and the raw fitbit log, all served by one values_batch_get"""
+        return (self.get_user_details(), self.get_project_details(),
+                self.get_fitbits_details(), self.get_fitbits_log())
+    
+    def get_user_details_df(self) -> pl.DataFrame:
+        """Get user details from the first worksheet as a Polars frame"""
+        return self._fetch_frame(0)
+    
+    def get_project_details_df(self) -> pl.DataFrame:
+        """Get project details from the second worksheet as a Polars frame"""
+        return self._fetch_frame(1)
+    
+    def get_fitbits_details_df(self) -> pl.DataFrame:
+        """Get fitbit details from the third worksheet as a Polars frame"""
+        return self._fetch_frame(2)
+    
+    def get_fitbits_log_df(self) -> pl.DataFrame:
+        """Get fitbit log from the fourth worksheet as a column-oriented Polars frame"""
+        return self._fetch_frame(3)
     
     def append_to_worksheet_3(self, data_list):
         """Append data to worksheet 3 with the latest Fitbit data"""
@@ -1061,26 +1360,13 @@ class LegacySpreadsheetManager:
             return
             
         worksheet = self.get_worksheet(3)
-        
-        # Define the expected column order
-        expected_columns = [
-            "project", "watchName", "lastCheck", "lastSynced", "lastBattary", 
-            "lastHR", "lastSleepStartDateTime", "lastSleepEndDateTime", "lastSteps", 
-            "lastBattaryVal", "lastHRVal", "lastHRSeq", "lastSleepDur", "lastStepsVal",
-            "CurrentFailedSync", "TotalFailedSync", "CurrentFailedHR", "TotalFailedHR",
-            "CurrentFailedSleep", "TotalFailedSleep", "CurrentFailedSteps", "TotalFailedSteps", "ID"
-        ]
-            
-        # Add data rows
-        for item in data_list:
-            # Map data to expected columns format
-            row_data = []
-            for col in expected_columns:
-                row_data.append(str(item.get(col, '')))
             
-            worksheet.append_row(row_data)
+        # Map data to expected columns format and add all rows in a single request
+        rows = list(map(_worksheet_3_values, data_list))
+        _with_retry(worksheet.append_rows, rows)
         
         print(f"Appended {len(data_list)} records to worksheet 3")
+        self.clear_cache()
         
         # Also update entity layer if possible
         try:
@@ -1106,17 +1392,19 @@ class LegacySpreadsheetManager:
 class LegacySpreadsheet:
     """Legacy API compatible with Spreadsheet_io.sheets.Spreadsheet"""
     _instance = None
+    _init_lock = threading.Lock()
     
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
-            cls._instance = LegacySpreadsheetManager.get_instance()
+            with cls._init_lock:
+                if cls._instance is None:
+                    cls._instance = LegacySpreadsheetManager.get_instance()
         return cls._instance
     
     @classmethod
     def get_client(cls):
-        instance = cls.get_instance()
-        return instance.sheets_api.client
+        return (cls._instance or cls.get_instance()).sheets_api.client
     
     @classmethod
     def get_user_details(cls):
@@ -1143,6 +1431,31 @@ class LegacySpreadsheet:
         instance = cls.get_instance()
         return instance.get_fitbits_log()
     
+    @classmethod
+    def get_all_sheets(cls):
+        instance = cls.get_instance()
+        return instance.get_all_sheets()
+    
+    @classmethod
+    def get_user_details_df(cls):
+        instance = cls.get_instance()
+        return instance.get_user_details_df()
+    
+    @classmethod
+    def get_project_details_df(cls):
+        instance = cls.get_instance()
+        return instance.get_project_details_df()
+    
+    @classmethod
+    def get_fitbits_details_df(cls):
+        instance = cls.get_instance()
+        return instance.get_fitbits_details_df()
+    
+    @classmethod
+    def get_fitbits_log_df(cls):
+        instance = cls.get_instance()
+        return instance.get_fitbits_log_df()
+    
     @classmethod
     def append_to_worksheet_3(cls, data_list):
         instance = cls.get_instance()
@@ -1152,90 +1465,90 @@ class LegacySpreadsheet:
     def get_entity_spreadsheet(cls):
         instance = cls.get_instance()
         return instance.get_entity_spreadsheet()
+    
+    @classmethod
+    def prefetch_all(cls):
+        LegacySpreadsheetManager.prefetch_all()
+    
+    @classmethod
+    def clear_cache(cls):
+        LegacySpreadsheetManager.clear_cache()
 
 
+@dataclass(slots=True, eq=False)
 class FitbitLog:
     """Legacy FitbitLog class for compatibility"""
-    def __init__(self, project, watchName, lastSynced, lastHR, lastHRVal, longestHRSeq, startActiveDate, isActive,
-                 endActiveDate, LastSleepStartDateTime, LastSleepEndDateTime, LastStepsMean,
-                 CurrentFailedSync=0, TotalFailedSync=0,
-                 CurrentFailedHR=0, TotalFailedHR=0,
-                 CurrentFailedSleep=0, TotalFailedSleep=0,
-                 CurrentFailedSteps=0, TotalFailedSteps=0):
-        self.project = project
-        self.watchName = watchName
-        self.lastSynced = lastSynced
-        self.lastHR = lastHR
-        self.lastHRVal = lastHRVal
-        self.longestHRSeq = longestHRSeq
-        self.startActiveDate = startActiveDate
-        self.isActive = isActive
-        self.endActiveDate = endActiveDate
-        self.LastSleepStartDateTime = LastSleepStartDateTime
-        self.LastSleepEndDateTime = LastSleepEndDateTime
-        self.LastStepsMean = LastStepsMean
-        self.CurrentFailedSync = CurrentFailedSync
-        self.TotalFailedSync = TotalFailedSync
-        self.CurrentFailedHR = CurrentFailedHR
-        self.TotalFailedHR = TotalFailedHR
-        self.CurrentFailedSleep = CurrentFailedSleep
-        self.TotalFailedSleep = TotalFailedSleep
-        self.CurrentFailedSteps = CurrentFailedSteps
-        self.TotalFailedSteps = TotalFailedSteps
+    project: Any
+    watchName: Any
+    lastSynced: Any
+    lastHR: Any
+    lastHRVal: Any
+    longestHRSeq: Any
+    startActiveDate: Any
+    isActive: Any
+    endActiveDate: Any
+    LastSleepStartDateTime: Any
+    LastSleepEndDateTime: Any
+    LastStepsMean: Any
+    CurrentFailedSync: int = 0
+    TotalFailedSync: int = 0
+    CurrentFailedHR: int = 0
+    TotalFailedHR: int = 0
+    CurrentFailedSleep: int = 0
+    TotalFailedSleep: int = 0
+    CurrentFailedSteps: int = 0
+    TotalFailedSteps: int = 0
+
+    _STR_FORMAT: ClassVar[Callable[..., str]] = "Fitbit Log: {}, {}".format
 
     def __str__(self):
-        return f"Fitbit Log: {self.project}, {self.watchName}"
+        return self._STR_FORMAT(self.project, self.watchName)
     
-    def __repr__(self):
-        return self.__str__()
+    __repr__ = __str__
     
     def __eq__(self, value):
-        if isinstance(value, FitbitLog):
-            return self.project == value.project and self.watchName == value.watchName
-        return False
-    
-    def __ne__(self, value):
-        return not self.__eq__(value)
+        if self is value:
+            return True
+        return type(value) is FitbitLog and (self.project, self.watchName) == (value.project, value.watchName)
     
     def __hash__(self):
+        # Hashed on demand, since project and watchName can be reassigned
         return hash((self.project, self.watchName))
     
     def __getitem__(self, key):
-        return self.__dict__.get(key)
+        return getattr(self, key, None)
 
 
+@dataclass(eq=False)
 class ServerLogFile:
     """Legacy ServerLogFile class for compatibility"""
-    def __init__(self, path=None):
+    # Not slotted: the dict-style helpers below accept arbitrary keys, stored in __dict__
+    path: Optional[str] = None
+    
+    def __post_init__(self):
         """Initialize serverLogFile with optional parameters."""
-        self.path = path or get_secrets().get("fitbit_log_path", "fitbit_log.csv")
-
+        self.path = self.path or self._default_path()
+    
+    @staticmethod
+    @functools.cache
+    def _default_path() -> str:
+        """Resolve the configured log path once per process instead of on every construction"""
+        return (get_secrets().get("fitbit_log_path")
+                or os.environ.get("FITBIT_LOG_PATH")
+                or "fitbit_log.csv")
+    
     def __str__(self):
         return f"Server Log File: {self.path}"
         
-    def __repr__(self):
-        return f"Server Log File: {self.path}"
+    __repr__ = __str__
         
     def __eq__(self, value):
-        if isinstance(value, ServerLogFile):
-            if self.path == value.path:
-                return True
-            else:
-                return False
-        else:
-            return False
-            
-    def __ne__(self, value):
-        if isinstance(value, ServerLogFile):
-            if self.path != value.path:
-                return True
-            else:
-                return False
-        else:
+        if self is value:
             return True
+        return type(value) is ServerLogFile and self.path == value.path
             
     def __hash__(self):
-        return hash((self.path))
+        return hash(self.path)
         
     def __len__(self):
         return len(self.__dict__)
@@ -1261,28 +1574,94 @@ class ServerLogFile:
     def get_path(self):
         return self.path
     
-    def get_all(self):
-        return self.__dict__
-        
-    def get_all_values(self):
-        return list(self.__dict__.values())
-        
-    def get_all_keys(self):
-        return list(self.__dict__.keys())
-        
-    def get_all_items(self):
-        return list(self.__dict__.items())
-        
-    def get_all_values_as_string(self):
-        return [str(value) for value in self.__dict__.values()]
+    def get_data_path(self) -> str:
+        """Directory the log history is stored in, next to the configured path, one subdirectory per day"""
+        return str(Path(self.path).with_suffix(""))
+    
+    def _write_partition(self, df: pl.DataFrame, partition: str) -> None:
+        """Write df as a new zstd-compressed Parquet file in partition, atomically"""
+        partition_dir = Path(self.get_data_path()) / partition
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        path = partition_dir / f"{uuid.uuid4().hex}.parquet"
+        tmp_path = path.with_suffix(".tmp")
+        df.write_parquet(tmp_path, compression="zstd", statistics=True)
+        os.replace(tmp_path, path)
+    
+    def _migrate_legacy_log(self) -> None:
+        """Move a single-file (Parquet or CSV) log history into the partitioned layout once"""
+        data_dir = Path(self.get_data_path())
+        if any(data_dir.glob("*/*.parquet")):
+            return
+        legacy_parquet = Path(self.path).with_suffix(".parquet")
+        if legacy_parquet.exists():
+            legacy_df = pl.read_parquet(legacy_parquet)
+        elif Path(self.path) != legacy_parquet and os.path.exists(self.path):
+            legacy_df = pl.read_csv(self.path)
+        else:
+            return
+        self._write_partition(_conform_log(legacy_df), "legacy")
+    
+    def _scan_log(self) -> Optional[pl.LazyFrame]:
+        """Lazily scan every partition of the log history, or None if there is none yet"""
+        self._migrate_legacy_log()
+        data_dir = Path(self.get_data_path())
+        if not any(data_dir.glob("*/*.parquet")):
+            return None
+        return pl.scan_parquet(str(data_dir / "*" / "*.parquet"))
+    
+    def _read_log(self) -> Optional[pl.DataFrame]:
+        """Read the full log history"""
+        log = self._scan_log()
+        return log.collect() if log is not None else None
+    
+    def _read_latest_log(self) -> Optional[pl.DataFrame]:
+        """Read only the most recent entry (by lastCheck) of each watch ID"""
+        log = self._scan_log()
+        if log is None:
+            return None
+        return log.group_by("ID").agg(pl.all().sort_by("lastCheck").last()).collect()
+    
+    def _append_log(self, df: pl.DataFrame) -> None:
+        """Append one run's entries to today's partition without touching the rest of the history"""
+        self._write_partition(df, datetime.date.today().isoformat())
+    
+    def compact_log(self, before: Optional[datetime.date] = None) -> int:
+        """
+        Rewrite each day partition older than before (today by default) into a single file.
         
-    def get_all_keys_as_string(self):
-        return [str(key) for key in self.__dict__.keys()]
+        Returns:
+            int: Number of partitions compacted
+        """
+        cutoff = (before or datetime.date.today()).isoformat()
+        compacted = 0
+        for partition_dir in sorted(Path(self.get_data_path()).glob("*")):
+            # Day partitions are ISO dates, so they compare in date order
+            if not partition_dir.is_dir() or partition_dir.name == "legacy" or partition_dir.name >= cutoff:
+                continue
+            files = sorted(partition_dir.glob("*.parquet"))
+            if len(files) < 2:
+                continue
+            try:
+                self._write_partition(pl.read_parquet(files), partition_dir.name)
+                for path in files:
+                    path.unlink()
+                compacted += 1
+            except Exception as e:
+                print(f"Error compacting log partition {partition_dir.name}: {e}")
+        return compacted
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the set keys as a dict, in insertion order"""
+        return dict(self.__dict__)
+    
+    def as_row(self, field_order: Optional[Tuple[str, ...]] = None) -> Tuple[Any, ...]:
+        """Return values as a tuple in field_order (insertion order by default)"""
+        return tuple(self.__dict__.get(name) for name in (field_order or self.__dict__))
     
     def update_fitbits_log(self, spreadsheet:Spreadsheet, fitbit_data: pl.DataFrame, reset_total_for_watches=None) -> bool:
         """
         Updates the Fitbit log files and sheets.
-        - CSV file: Always append (full history)
+        - Log history: Always append (one Parquet file per run, partitioned by day)
         - "log" sheet: Replace with latest records only (one per watch)
         - "FitbitLog" sheet: Always append (full history)
         
@@ -1302,71 +1681,24 @@ class ServerLogFile:
         # Get current time for timestamp
         now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # Define expected columns for the CSV
-        expected_columns = [
-            "project", "watchName", "lastCheck", "lastSynced", "lastBattary", 
-            "lastHR", "lastSleepStartDateTime", "lastSleepEndDateTime", "lastSteps", 
-            "lastBattaryVal", "lastHRVal", "lastHRSeq", "lastSleepDur", "lastStepsVal",
-            "CurrentFailedSync", "TotalFailedSync", "CurrentFailedHR", "TotalFailedHR",
-            "CurrentFailedSleep", "TotalFailedSleep", "CurrentFailedSteps", "TotalFailedSteps",
-            "CurrentFailedBattary", "TotalFailedBattary", "ID"
-        ]
-        
         # Convert reset_total_for_watches to a set for faster lookups
         reset_watches = set(reset_total_for_watches or [])
         
         try:
-            # Initialize or load existing data
-            if os.path.exists(self.path):
-                try:
-                    existing_df = pl.read_csv(self.path)
-                    # Print debug info
-                    print(f"Existing log file schema: {existing_df.schema}")
-                    # Ensure all expected columns exist
-                    for col in expected_columns:
-                        if col not in existing_df.columns:
-                            existing_df = existing_df.with_columns(pl.lit("").alias(col))
-                    
-                    # Convert all columns to strings (Utf8) to avoid type mismatches
-                    existing_df = existing_df.select([
-                        pl.col(col).cast(pl.Utf8) for col in existing_df.columns
-                    ])
-                except Exception as e:
-                    print(f"Error reading existing log file: {e}")
-                    existing_df = pl.DataFrame({col: [] for col in expected_columns})
-            else:
-                existing_df = pl.DataFrame({col: [] for col in expected_columns})
+            # Only the latest entry per watch is needed for the failure counters,
+            # so the (append-only) history is never loaded in full here
+            latest_df = None
+            try:
+                latest_df = self._read_latest_log()
+            except Exception as e:
+                print(f"Error reading existing log file: {e}")
             
             # Get previous log entries to keep track of failure counters
-            # Create a map of watch ID to most recent log entry
-            previous_log_entries = {}
-            if not existing_df.is_empty():
-                # Get the most recent entry for each watch
-                for watch_id in existing_df.select("ID").unique().to_series():
-                    watch_entries = existing_df.filter(pl.col("ID") == watch_id)
-                    # Sort by lastCheck to get the most recent entry
-                    if "lastCheck" in watch_entries.columns:
-                        watch_entries = watch_entries.sort(pl.col("lastCheck"), descending=True)
-                    # Get the first (most recent) entry as a dictionary
-                    if not watch_entries.is_empty():
-                        previous_log_entries[watch_id] = watch_entries.row(0, named=True)
+            # One row per watch ID holding its most recent log entry
+            previous_log_df = latest_df if latest_df is not None else pl.DataFrame(schema=FITBIT_LOG_SCHEMA)
             
-            # Process each row from the Fitbit data
-            new_log_entries = []
-            latest_entries_by_watch = {}  # Dictionary to store latest entry per watch
-            
-            for row in fitbit_data.iter_rows(named=True):
-                # Create watch ID for matching - try to use the same logic as in hourly_data_collection
-                watch_id = str(row.get('id', row.get('deviceId', '')))
-                if not watch_id and 'project' in row and 'name' in row:
-                    watch_id = f"{row.get('project', '')}-{row.get('name', '')}"
-                
-                # Check if watch is active
-                is_active = str(row.get('isActive', '')).upper() != 'FALSE'
-                if not is_active:
-                    # Skip processing inactive watches
-                    continue
-                
+            def refresh_row(row: dict) -> dict:
+                """Return row with its values refreshed from the Fitbit API, or unchanged if that fails"""
                 # Create a Watch object and update data via API
                 try:
                     # Convert row data to a dict for the factory
@@ -1376,7 +1708,7 @@ class ServerLogFile:
                     watch = WatchFactory.create_from_details(watch_data)
                     
                     # Update device information via Fitbit API
-                    print(f"Fetching latest data from Fitbit API for watch {watch.name}...")
+                    logger.debug("Fetching latest data from Fitbit API for watch %s...", watch.name)
                     # Use the proper API method to update watch data
                     watch.update_device_info()
                     
@@ -1393,190 +1725,147 @@ class ServerLogFile:
                             "sleep_duration": watch.get_last_sleep_duration() if hasattr(watch, 'get_last_sleep_duration') else "",
                             "steps": watch.get_current_hourly_steps() if hasattr(watch, 'get_current_hourly_steps') else ""
                         }
-                        print(f"Successfully updated data for watch {watch.name} from Fitbit API")
+                        logger.debug("Successfully updated data for watch %s from Fitbit API", watch.name)
                     else:
                         print(f"Failed to update data for watch {watch.name} from Fitbit API, using existing data")
                 except Exception as e:
                     print(f"Error creating/updating watch {row.get('name', '')} via API: {e}")
                     # Continue with existing data
+                return row
+            
+            # Skip processing inactive watches
+            active_rows = [row for row in fitbit_data.iter_rows(named=True)
+                           if str(row.get('isActive', '')).upper() != 'FALSE']
+            # Each refresh is several Fitbit round trips, so overlap them across watches
+            refreshed_rows = map_watches(refresh_row, active_rows)
+            
+            # Process each row from the Fitbit data
+            # Column buffers for this run's checks; the log entries are derived from them in Polars below
+            check_columns = {column: [] for column in CHECK_SOURCE_COLUMNS + ("ID", "lastHRSeq")}
+            flag_columns = {f"ok{kind}": [] for kind in FAILURE_KINDS}
+            
+            for row in refreshed_rows:
+                # Create watch ID for matching - try to use the same logic as in hourly_data_collection
+                watch_id = str(row.get('id', row.get('deviceId', '')))
+                if not watch_id and 'project' in row and 'name' in row:
+                    watch_id = f"{row.get('project', '')}-{row.get('name', '')}"
                 
-                # Get previous log entry if available to keep track of failure counters
-                prev_entry = previous_log_entries.get(watch_id, {})
-                
-                # Initialize failure counters with previous values or 0
-                current_failed_sync = int(prev_entry.get("CurrentFailedSync", 0) or 0)
-                total_failed_sync = int(prev_entry.get("TotalFailedSync", 0) or 0)
-                current_failed_hr = int(prev_entry.get("CurrentFailedHR", 0) or 0)
-                total_failed_hr = int(prev_entry.get("TotalFailedHR", 0) or 0)
-                current_failed_sleep = int(prev_entry.get("CurrentFailedSleep", 0) or 0)
-                total_failed_sleep = int(prev_entry.get("TotalFailedSleep", 0) or 0)
-                current_failed_steps = int(prev_entry.get("CurrentFailedSteps", 0) or 0)
-                total_failed_steps = int(prev_entry.get("TotalFailedSteps", 0) or 0)
-                current_failed_battery = int(prev_entry.get("CurrentFailedBattary", 0) or 0)
-                total_failed_battery = int(prev_entry.get("TotalFailedBattary", 0) or 0)
-                
-                # Reset total failures if this watch is in the reset list
                 if watch_id in reset_watches:
                     print(f"Resetting total failure counters for watch {row.get('name', '')} (ID: {watch_id})")
-                    total_failed_sync = 0
-                    total_failed_hr = 0
-                    total_failed_sleep = 0
-                    total_failed_steps = 0
-                    total_failed_battery = 0
-                
-                # Track success/failure for each data type
-                sync_success = bool(row.get("syncDate"))
-                hr_success = bool(row.get("HR"))
-                sleep_success = bool(row.get("sleep_start"))
-                steps_success = bool(row.get("steps"))
-                battery_success = bool(row.get("battery"))
-                
-                # Update failure counters based on success/failure
-                if sync_success:
-                    current_failed_sync = 0  # Reset current count on success
-                else:
-                    current_failed_sync += 1
-                    total_failed_sync += 1
-                
-                if hr_success:
-                    current_failed_hr = 0  # Reset current count on success
-                else:
-                    current_failed_hr += 1
-                    total_failed_hr += 1
-                
-                if sleep_success:
-                    current_failed_sleep = 0  # Reset current count on success
-                else:
-                    current_failed_sleep += 1
-                    total_failed_sleep += 1
-                
-                if steps_success:
-                    current_failed_steps = 0  # Reset current count on success
-                else:
-                    current_failed_steps += 1
-                    total_failed_steps += 1
-                
-                if battery_success:
-                    current_failed_battery = 0  # Reset current count on success
-                else:
-                    current_failed_battery += 1
-                    total_failed_battery += 1
-                
-                # Build the log entry with updated failure counters
-                log_entry = {
-                    "project": row.get("project", ""),
-                    "watchName": row.get("name", ""),
-                    "lastCheck": now,
-                    "lastSynced": row.get("syncDate", ""),
-                    "lastBattary": now if row.get("battery") else "",
-                    "lastHR": now if row.get("HR") else "",
-                    "lastSleepStartDateTime": row.get("sleep_start", ""),
-                    "lastSleepEndDateTime": row.get("sleep_end", ""),
-                    "lastSteps": now if row.get("steps") else "",
-                    "lastBattaryVal": row.get("battery", ""),
-                    "lastHRVal": row.get("HR", ""),
-                    "lastHRSeq": self._calculate_hr_sequence(row),
-                    "lastSleepDur": row.get("sleep_duration", ""),
-                    "lastStepsVal": row.get("steps", ""),
-                    "CurrentFailedSync": current_failed_sync,
-                    "TotalFailedSync": total_failed_sync,
-                    "CurrentFailedHR": current_failed_hr,
-                    "TotalFailedHR": total_failed_hr,
-                    "CurrentFailedSleep": current_failed_sleep,
-                    "TotalFailedSleep": total_failed_sleep,
-                    "CurrentFailedSteps": current_failed_steps,
-                    "TotalFailedSteps": total_failed_steps,
-                    "CurrentFailedBattary": current_failed_battery,
-                    "TotalFailedBattary": total_failed_battery,
-                    "ID": watch_id
-                }
                 
-                # Add to the list of all entries
-                new_log_entries.append(log_entry)
-                
-                # Keep track of latest entry for each unique watch ID
-                latest_entries_by_watch[watch_id] = log_entry
+                # Record this check's raw values and success flags; renaming and the
+                # failure counters are computed for all watches at once below
+                for column in CHECK_SOURCE_COLUMNS:
+                    check_columns[column].append(row.get(column, ""))
+                for flag, ok in _check_flags(row).items():
+                    flag_columns[flag].append(ok)
+                check_columns["ID"].append(watch_id)
+                check_columns["lastHRSeq"].append(self._calculate_hr_sequence(row))
+            
+            raw_checks_df = pl.concat([
+                pl.DataFrame(check_columns, schema={column: pl.Utf8 for column in check_columns}, strict=False),
+                pl.DataFrame(flag_columns, schema={flag: pl.Boolean for flag in flag_columns}),
+            ], how="horizontal")
+            checks_df = raw_checks_df.select(
+                pl.col("project"),
+                pl.col("name").alias("watchName"),
+                pl.col("syncDate").alias("lastSynced"),
+                pl.col("sleep_start").alias("lastSleepStartDateTime"),
+                pl.col("sleep_end").alias("lastSleepEndDateTime"),
+                pl.col("battery").alias("lastBattaryVal"),
+                pl.col("HR").alias("lastHRVal"),
+                pl.col("lastHRSeq"),
+                pl.col("sleep_duration").alias("lastSleepDur"),
+                pl.col("steps").alias("lastStepsVal"),
+                pl.col("ID"),
+                pl.col([f"ok{kind}" for kind in FAILURE_KINDS]),
+            )
+            
+            stamp_if = lambda ok: pl.when(pl.col(ok)).then(pl.lit(now)).otherwise(pl.lit(""))
+            # Build one columnar frame with a fixed schema and share it between
+            # the log sheet, the CSV file and the FitbitLog sheet
+            new_entries_df = (
+                _apply_failure_counters(checks_df, previous_log_df, reset_watches)
+                .with_columns(
+                    pl.lit(now).alias("lastCheck"),
+                    stamp_if("okBattary").alias("lastBattary"),
+                    stamp_if("okHR").alias("lastHR"),
+                    stamp_if("okSteps").alias("lastSteps"),
+                )
+                .select([pl.col(col).cast(dtype) for col, dtype in FITBIT_LOG_SCHEMA.items()])
+            )
             
-            # For "log" sheet - Use REPLACE strategy (latest records only - one per watch)
-            if latest_entries_by_watch:
+            def replace_log_sheet():
+                # "log" sheet - Use REPLACE strategy (latest records only - one per watch)
+                if new_entries_df.is_empty():
+                    return
                 try:
-                    # Get the legacy spreadsheet manager
-                    new_df = pl.DataFrame(list(latest_entries_by_watch.values()))
+                    latest_df = new_entries_df.unique(subset="ID", keep="last", maintain_order=True)
 
-                    spreadsheet.update_sheet("log", new_df, strategy="replace")
+                    spreadsheet.update_sheet("log", latest_df, strategy="replace")
                     # Use our improved save method with rewrite mode for this sheet
                     GoogleSheetsAdapter.save(spreadsheet, "log", mode="rewrite")
                     
-                    print(f"Replaced log sheet with {len(latest_entries_by_watch)} latest records (one per watch)")
+                    print(f"Replaced log sheet with {latest_df.height} latest records (one per watch)")
                 except Exception as e:
                     print(f"Error updating log sheet: {e}")
                     print(f"Error details: {traceback.format_exc()}")
             
-            # For CSV file - Always APPEND (keep full history)
-            if new_log_entries:
-                # Convert new entries to DataFrame with explicit string types
-                new_entries_df = pl.DataFrame(new_log_entries)
-                print(f"New entries schema: {new_entries_df.schema}")
-                
-                # Convert all columns to strings to avoid type issues
-                new_entries_df = new_entries_df.select([
-                    pl.col(col).cast(pl.Utf8) for col in new_entries_df.columns
-                ])
-                
-                # Make sure both DataFrames have the same columns
-                # Get common columns
-                common_cols = list(set(existing_df.columns).intersection(set(new_entries_df.columns)))
-                if len(common_cols) < len(existing_df.columns) or len(common_cols) < len(new_entries_df.columns):
-                    print(f"Warning: Column mismatch: existing has {existing_df.columns}, new has {new_entries_df.columns}")
-                    # Select only common columns
-                    existing_df = existing_df.select(common_cols)
-                    new_entries_df = new_entries_df.select(common_cols)
-                
-                # ALWAYS append to existing CSV (never replace)
-                try:
-                    final_df = pl.concat([existing_df, new_entries_df], how="vertical")
-                    final_df.write_csv(self.path)
-                    print(f"Appended {len(new_log_entries)} records to log file (total: {len(final_df)})")
-                except Exception as e:
-                    print(f"Error during CSV concatenation: {e}")
-                    print(f"Existing types: {[existing_df[col].dtype for col in common_cols]}")
-                    print(f"New types: {[new_entries_df[col].dtype for col in common_cols]}")
-                    # Fall back to overwriting if append fails
-                    print("Falling back to creating new CSV file")
-                    new_entries_df.write_csv(self.path)
-                    print(f"Created new log file with {len(new_entries_df)} records")
-            else:
-                print("No active watch data to append to log file")
-            
-            # For "FitbitLog" sheet - Always APPEND (keep full history)
+            # Resolve the entity spreadsheet here, on the calling thread, before any upload starts
             try:
-                # Get entity spreadsheet
                 entity_sp = LegacySpreadsheetManager.get_instance().get_entity_spreadsheet()
-                
-                # First make sure the FitbitLog sheet exists
-                if "FitbitLog" not in entity_sp.sheets:
-                    print("Creating new FitbitLog sheet since it doesn't exist")
-                    entity_sp.get_sheet("FitbitLog", "log")
-                
-                # Update the FitbitLog sheet with only the NEW log entries
-                # Instead of extending the data, we use our updated save method with append mode
-                if new_log_entries:
-                    # Create a new DataFrame with just the new entries
-                    fitbit_log_df = pl.DataFrame(new_log_entries)
-                    
-                    # Update the sheet with only the new data
-                    entity_sp.update_sheet("FitbitLog", fitbit_log_df, strategy="append")
-                    
-                    # Use our new save method with append mode to efficiently add only new records
-                    print("Saving only new records to FitbitLog sheet using append mode...")
-                    GoogleSheetsAdapter.save(entity_sp, "FitbitLog", mode="append")
-                    print(f"Successfully appended {len(new_log_entries)} records to FitbitLog sheet")
-                else:
-                    print("No new data to append to FitbitLog sheet")
             except Exception as e:
-                print(f"Error updating FitbitLog sheet: {e}")
-                print(f"Error details: {traceback.format_exc()}")
-                
+                print(f"Error getting entity spreadsheet for FitbitLog sheet: {e}")
+                entity_sp = None
+            
+            def append_fitbit_log_sheet():
+                # "FitbitLog" sheet - Always APPEND (keep full history)
+                if entity_sp is None:
+                    return
+                try:
+                    # First make sure the FitbitLog sheet exists
+                    if "FitbitLog" not in entity_sp.sheets:
+                        print("Creating new FitbitLog sheet since it doesn't exist")
+                        entity_sp.get_sheet("FitbitLog", "log")
+                    
+                    # Update the FitbitLog sheet with only the NEW log entries
+                    # Instead of extending the data, we use our updated save method with append mode
+                    if not new_entries_df.is_empty():
+                        # Update the sheet with only the new data
+                        entity_sp.update_sheet("FitbitLog", new_entries_df, strategy="append")
+                        
+                        # Use our new save method with append mode to efficiently add only new records
+                        print("Saving only new records to FitbitLog sheet using append mode...")
+                        GoogleSheetsAdapter.save(entity_sp, "FitbitLog", mode="append")
+                        print(f"Successfully appended {new_entries_df.height} records to FitbitLog sheet")
+                    else:
+                        print("No new data to append to FitbitLog sheet")
+                except Exception as e:
+                    print(f"Error updating FitbitLog sheet: {e}")
+                    print(f"Error details: {traceback.format_exc()}")
+            
+            def append_log_history():
+                # For the log history - Always APPEND (keep full history) as a new file
+                if new_entries_df.is_empty():
+                    print("No active watch data to append to log file")
+                    return
+                try:
+                    self._append_log(new_entries_df)
+                    print(f"Appended {new_entries_df.height} records to log history")
+                    # Fold the per-run files of earlier days into one file per day
+                    self.compact_log()
+                except Exception as e:
+                    print(f"Error appending to log history: {e}")
+            
+            # Write the local history file in the background while the sheet uploads run.
+            # The uploads stay sequential: each save clears the shared sheet caches and they
+            # may touch the same Spreadsheet object
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                history_write = pool.submit(append_log_history)
+                replace_log_sheet()
+                append_fitbit_log_sheet()
+                history_write.result()
+            
             return True
         except Exception as e:
             print(f"Error in update_fitbits_log: {e}")
@@ -1598,16 +1887,6 @@ class ServerLogFile:
         # Get current time for timestamp
         now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # Define expected columns for entries
-        expected_columns = [
-            "project", "watchName", "lastCheck", "lastSynced", "lastBattary", 
-            "lastHR", "lastSleepStartDateTime", "lastSleepEndDateTime", "lastSteps", 
-            "lastBattaryVal", "lastHRVal", "lastHRSeq", "lastSleepDur", "lastStepsVal",
-            "CurrentFailedSync", "TotalFailedSync", "CurrentFailedHR", "TotalFailedHR",
-            "CurrentFailedSleep", "TotalFailedSleep", "CurrentFailedSteps", "TotalFailedSteps",
-            "CurrentFailedBattary", "TotalFailedBattary", "ID"
-        ]
-        
         # Convert reset_total_for_watches to a set for faster lookups
         reset_watches = set(reset_total_for_watches or [])
         
@@ -1618,16 +1897,8 @@ class ServerLogFile:
                 log_sheet = spreadsheet.get_sheet("FitbitLog", "log")
                 log_df = log_sheet.to_dataframe(engine="polars")
                 
-                if not log_df.is_empty() and "ID" in log_df.columns:
-                    # Get the most recent entry for each watch
-                    for watch_id in log_df.select("ID").unique().to_series():
-                        watch_entries = log_df.filter(pl.col("ID") == watch_id)
-                        # Sort by lastCheck to get the most recent entry
-                        if "lastCheck" in watch_entries.columns:
-                            watch_entries = watch_entries.sort(pl.col("lastCheck"), descending=True)
-                        # Get the first (most recent) entry as a dictionary
-                        if not watch_entries.is_empty():
-                            previous_log_entries[watch_id] = watch_entries.row(0, named=True)
+                # Get the most recent entry for each watch
+                previous_log_entries = _latest_entries_by_id(log_df)
         except Exception as e:
             print(f"Error getting previous log entries: {e}")
             print(traceback.format_exc())
@@ -1655,7 +1926,7 @@ class ServerLogFile:
                 watch = WatchFactory.create_from_details(watch_data)
                 
                 # Update device information via Fitbit API
-                print(f"Fetching latest data from Fitbit API for watch {watch.name}...")
+                logger.debug("Fetching latest data from Fitbit API for watch %s...", watch.name)
                 watch.update_device_info()
                 
                 # Check if essential attributes were updated
@@ -1671,7 +1942,7 @@ class ServerLogFile:
                         "sleep_duration": watch.get_last_sleep_duration() if hasattr(watch, 'get_last_sleep_duration') else "",
                         "steps": watch.get_current_hourly_steps() if hasattr(watch, 'get_current_hourly_steps') else ""
                     }
-                    print(f"Successfully updated data for watch {watch.name} from Fitbit API")
+                    logger.debug("Successfully updated data for watch %s from Fitbit API", watch.name)
                 else:
                     print(f"Failed to update data for watch {watch.name} from Fitbit API, using existing data")
             except Exception as e:
@@ -1794,18 +2065,17 @@ class ServerLogFile:
                 return True
                 
             # For log sheet, we keep only the latest entry per watch
-            latest_entries_by_watch = {}
-            for entry in new_log_entries:
-                watch_id = entry.get('ID', '')
-                if watch_id:
-                    latest_entries_by_watch[watch_id] = entry
+            log_df = (
+                pl.DataFrame(new_log_entries, schema=FITBIT_LOG_SCHEMA, strict=False)
+                .filter(pl.col("ID") != "")
+                .unique(subset="ID", keep="last", maintain_order=True)
+            )
             
             # Update the log sheet with the latest entries (replace strategy)
-            log_df = pl.DataFrame(list(latest_entries_by_watch.values()))
             spreadsheet.update_sheet("log", log_df, strategy="replace")
             GoogleSheetsAdapter.save(spreadsheet, "log", mode="rewrite")
             
-            print(f"Updated log sheet with {len(latest_entries_by_watch)} latest entries (one per watch)")
+            print(f"Updated log sheet with {log_df.height} latest entries (one per watch)")
             return True
             
         except Exception as e:
@@ -1820,24 +2090,24 @@ class ServerLogFile:
     def get_summary_statistics(self):
         """Get summary statistics about watch failures"""
         try:
-            if os.path.exists(self.path):
-                df = pl.read_csv(self.path)
-                if df.is_empty():
-                    return {}
-                
-                return {
-                    "total_watches": len(df),
-                    "sync_failures": df.filter(pl.col("CurrentFailedSync") > 0).height,
-                    "hr_failures": df.filter(pl.col("CurrentFailedHR") > 0).height,
-                    "sleep_failures": df.filter(pl.col("CurrentFailedSleep") > 0).height,
-                    "steps_failures": df.filter(pl.col("CurrentFailedSteps") > 0).height,
-                    "total_failures": df.filter(
-                        (pl.col("CurrentFailedSync") > 0) |
-                        (pl.col("CurrentFailedHR") > 0) |
-                        (pl.col("CurrentFailedSleep") > 0) |
-                        (pl.col("CurrentFailedSteps") > 0)
-                    ).height
-                }
+            log = self._scan_log()
+            if log is not None:
+                # One lazy pass over every partition, projecting only the counter columns
+                failed = lambda col: pl.col(col).cast(pl.Int64, strict=False) > 0
+                stats = log.select(
+                    pl.len().alias("total_watches"),
+                    failed("CurrentFailedSync").sum().alias("sync_failures"),
+                    failed("CurrentFailedHR").sum().alias("hr_failures"),
+                    failed("CurrentFailedSleep").sum().alias("sleep_failures"),
+                    failed("CurrentFailedSteps").sum().alias("steps_failures"),
+                    (
+                        failed("CurrentFailedSync") |
+                        failed("CurrentFailedHR") |
+                        failed("CurrentFailedSleep") |
+                        failed("CurrentFailedSteps")
+                    ).sum().alias("total_failures"),
+                ).collect().row(0, named=True)
+                return stats if stats["total_watches"] else {}
         except Exception as e:
             print(f"Error getting summary statistics: {e}")
         
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Set, Any, Union
 from enum import Enum
+import threading
 import uuid
 from abc import ABC, abstractmethod
 import datetime
@@ -272,24 +273,21 @@ class UserFactory:
 class UserRepository:
     """Repository for storing and retrieving users"""
     _instance = None
+    _init_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(UserRepository, cls).__new__(cls)
-            cls._instance._users = {}
-            cls._instance._initialized = False
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = super(UserRepository, cls).__new__(cls)
+                    instance._users = {}  # Dictionary of users by ID
+                    instance._name_index = {}  # Index of users by name
+                    instance._email_index = {}  # Index of users by email
+                    instance._role_index = {}  # Index of users by role
+                    instance._project_index = {}  # Index of users by project
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if getattr(self, '_initialized', False):
-            return
-        self._initialized = True
-        self._users = {}  # Dictionary of users by ID
-        self._name_index = {}  # Index of users by name
-        self._email_index = {}  # Index of users by email
-        self._role_index = {}  # Index of users by role
-        self._project_index = {}  # Index of users by project
-    
     def add(self, user: User) -> None:
         """Add a user to the repository"""
         # Store user by ID
@@ -1,6 +1,12 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any, Union, Callable, TypeVar, TYPE_CHECKING
@@ -8,6 +14,11 @@ from enum import Enum
 from abc import ABC, abstractmethod
 from entity.User import User
 import streamlit as st
+try:
+    import orjson
+except ImportError:
+    # Fall back to requests' stdlib json decoding
+    orjson = None
 # Use string references for Project to avoid circular imports
 if TYPE_CHECKING:
     from entity.Project import Project
@@ -15,8 +26,6 @@ if TYPE_CHECKING:
 # Constants - preserve existing URL definitions
 BASE_URL2 = "https://api.fitbit.com/1.2/user/-/"
 BASE_URL = "https://api.fitbit.com/1/user/-/"
-HEADERS = {"Accept": "application/json",
-            "Authorization": "Bearer {}"}
 URL_DICT = {
     'Sleep': "https://api.fitbit.com/1.2/user/-/sleep/date/{}/{}.json", # BASE_URL2, start_date, end_date
     'Steps': "https://api.fitbit.com/1.2/user/-/activities/steps/date/{}/{}.json", # BASE_URL2, start_date, end_date
@@ -37,6 +46,96 @@ URL_DICT = {
 }
 
 
+# Fitbit rate limits are per token, so requests for different watches can overlap
+FETCH_WORKERS = 16
+# Upper bound on concurrent requests for a dashboard refresh, which fans out per watch and per metric
+DASHBOARD_WORKERS = 32
+# (connect, read) timeouts for Fitbit API requests, in seconds
+REQUEST_TIMEOUT = (3.05, 15)
+
+
+def _build_session() -> requests.Session:
+    """Shared keep-alive session, so Fitbit requests reuse TLS connections instead of handshaking each time"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=DASHBOARD_WORKERS,
+        # Wait for a pooled connection rather than opening a throwaway socket (and TLS handshake)
+        pool_block=True,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                          raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+SESSION = _build_session()
+
+
+# Per-token TTL caches for readings that change at most every few minutes on Fitbit's side,
+# shared by every Watch object (and Streamlit rerun) in the process
+DEVICE_CACHE_TTL = 300  # seconds
+SLEEP_CACHE_TTL = 600  # seconds
+INTRADAY_CACHE_TTL = 60  # seconds, the finest granularity the hourly readings are shown at
+VALIDATOR_CACHE_TTL = 3600  # seconds an ETag/Last-Modified validator and its body are kept for
+TOKEN_CACHE_MAX_ENTRIES = 1024
+_token_cache: Dict[tuple, tuple] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_get(key: tuple, ttl: float) -> Any:
+    """Return the value cached under key if it is younger than ttl, else None"""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _token_cache_put(key: tuple, value: Any) -> None:
+    with _token_cache_lock:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            # Entries older than the longest TTL can never be served again
+            horizon = time.monotonic() - max(DEVICE_CACHE_TTL, SLEEP_CACHE_TTL, VALIDATOR_CACHE_TTL)
+            for stale in [k for k, (stored, _) in _token_cache.items() if stored < horizon]:
+                del _token_cache[stale]
+        _token_cache[key] = (time.monotonic(), value)
+
+
+def _token_cache_forget(token: str) -> None:
+    """Drop everything cached for token, e.g. after Fitbit rejected it"""
+    with _token_cache_lock:
+        for key in [k for k in _token_cache if k[0] == token]:
+            del _token_cache[key]
+
+# Request parameters filled into each URL_DICT template, in placeholder order
+URL_PARAMS = {
+    'Sleep': ('start_date', 'end_date'),
+    'Sleep Levels': ('start_date', 'end_date'),
+    'Steps': ('start_date', 'end_date'),
+    'Heart Rate': ('start_date', 'end_date'),
+    'Heart Rate Intraday': ('start_date', 'start_time', 'end_time'),
+    'Steps Intraday': ('start_date', 'start_time', 'end_time'),
+    'device': (),
+}
+# f-string builders mirroring URL_DICT, so building a request URL does not re-parse a format string
+_URL_FORMATTERS = {
+    'Sleep': lambda start_date, end_date: f"https://api.fitbit.com/1.2/user/-/sleep/date/{start_date}/{end_date}.json",
+    'Sleep Levels': lambda start_date, end_date: f"https://api.fitbit.com/1.2/user/-/sleep/date/{start_date}/{end_date}.json",
+    'Steps': lambda start_date, end_date: f"https://api.fitbit.com/1.2/user/-/activities/steps/date/{start_date}/{end_date}.json",
+    'Heart Rate': lambda start_date, end_date: f"https://api.fitbit.com/1/user/-/activities/heart/date/{start_date}/{end_date}.json",
+    'Heart Rate Intraday': lambda start_date, start_time, end_time: f"https://api.fitbit.com/1.2/user/-/activities/heart/date/{start_date}/1d/1sec/time/{start_time}/{end_time}.json",
+    'Steps Intraday': lambda start_date, start_time, end_time: f"https://api.fitbit.com/1/user/-/activities/steps/date/{start_date}/1d/1min/time/{start_time}/{end_time}.json",
+    'device': lambda: URL_DICT['device'],
+}
+
+
+def build_url(endpoint_type: str, params: Dict) -> str:
+    """Fill the URL template of endpoint_type from params"""
+    return _URL_FORMATTERS[endpoint_type](*map(params.get, URL_PARAMS[endpoint_type]))
+
+
 # ===== Data Types and Enums =====
 
 class DataType(Enum):
@@ -66,7 +165,7 @@ class TimeRange(Enum):
 class RequestBuilder:
     """Builder pattern for creating API requests"""
     
-    def __init__(self, endpoint_type: str, token: str):
+    def __init__(self, endpoint_type: str, token: str, headers: Optional[Dict[str, str]] = None):
         self.endpoint_type = endpoint_type
         if hasattr(token, 'item') and callable(token.item):
             self.token = token.item()
@@ -74,7 +173,7 @@ class RequestBuilder:
             self.token = token
         else:
             self.token = str(token)
-        self.headers = get_headers(self.token)
+        self.headers = headers if headers is not None else get_headers(self.token)
         self.params = {}
         self.url = None
         self.date_format = "%Y-%m-%d"
@@ -178,26 +277,8 @@ class RequestBuilder:
         if not url_template:
             raise ValueError(f"Unknown endpoint type: {self.endpoint_type}")
             
-        if self.endpoint_type == 'Sleep' or self.endpoint_type == 'Sleep Levels':
-            self.url = url_template.format(self.params.get('start_date'), self.params.get('end_date'))
-        elif self.endpoint_type == 'Steps':
-            self.url = url_template.format(self.params.get('start_date'), self.params.get('end_date'))
-        elif self.endpoint_type == 'Heart Rate':
-            self.url = url_template.format(self.params.get('start_date'), self.params.get('end_date'))
-        elif self.endpoint_type == 'Heart Rate Intraday':
-            self.url = url_template.format(
-                self.params.get('start_date'),
-                self.params.get('start_time'),
-                self.params.get('end_time')
-            )
-        elif self.endpoint_type == 'Steps Intraday':
-            self.url = url_template.format(
-                self.params.get('start_date'),
-                self.params.get('start_time'),
-                self.params.get('end_time')
-            )
-        elif self.endpoint_type == 'device':
-            self.url = url_template
+        if self.endpoint_type in _URL_FORMATTERS:
+            self.url = build_url(self.endpoint_type, self.params)
         
         # st.write(f"Request URL: {self.url}")
         if self.is_intraday_endpoint() and 'start_date' in self.params and 'end_date' in self.params:
@@ -437,7 +518,7 @@ class ProcessorFactory:
 
 # ===== Watch-Student Association Manager =====
 
-@dataclass
+@dataclass(slots=True)
 class WatchAssignment:
     watch: 'Watch'
     student: User
@@ -496,13 +577,13 @@ class WatchAssignmentManager:
 
 # ===== Enhanced Watch Class =====
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Watch:
     """Enhanced Watch entity class using design patterns"""
     name: str
     project: str  
     token: str
-    header: Dict = field(init=False, default_factory=dict)
+    header: Dict[str, str] = field(init=False, default_factory=dict)
     current_student: Optional[User] = None
     previous_student: Optional[User] = None
     is_active: bool = True
@@ -513,18 +594,12 @@ class Watch:
     
     def __post_init__(self):
         """Initialize after the dataclass initialization"""
-        token_value = self.token
-
-        self.header = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {token_value}"
-        }
+        # Built once per watch and shared read-only by every request it makes
+        self.header = get_headers(self.token)
     
     def __eq__(self, other):
         """Equal comparison based on watch name and project"""
-        if not isinstance(other, Watch):
-            return False
-        return self.name == other.name and self.project == other.project
+        return isinstance(other, Watch) and (self.name, self.project) == (other.name, other.project)
     
     def __hash__(self):
         """Hash for using in dictionaries and sets"""
@@ -537,7 +612,7 @@ class Watch:
         if not force_fetch and cache_key in self._cached_data:
             return self._cached_data[cache_key]
             
-        builder = RequestBuilder(endpoint_type, self.token)
+        builder = RequestBuilder(endpoint_type, self.token, self.header)
         
         # Apply request parameters based on kwargs
         if 'start_date' in kwargs:
@@ -565,14 +640,27 @@ class Watch:
                 self._cached_data[cache_key] = result
             return result
         
-        # Execute the request
-        response = requests.get(request['url'], headers=request['headers'])
+        # Execute the request, conditionally if an earlier response carried a validator
+        validator_key = (self.token, 'validators', request['url'])
+        validated = _token_cache_get(validator_key, VALIDATOR_CACHE_TTL)
+        headers = request['headers'] if validated is None else {**request['headers'], **validated[0]}
+        response = SESSION.get(request['url'], headers=headers, timeout=REQUEST_TIMEOUT)
         
-        if response.status_code != 200:
-            print(f"Error fetching {endpoint_type} data: {response.status_code}")
-            return {}
-        
-        result = response.json()
+        if response.status_code == 304 and validated is not None:
+            # Unchanged since the validated response, so reuse its parsed body
+            result = validated[1]
+        else:
+            if response.status_code == 401:
+                # The token is no longer valid, so nothing cached under it can be trusted
+                _token_cache_forget(self.token)
+            if response.status_code != 200:
+                print(f"Error fetching {endpoint_type} data: {response.status_code}")
+                return {}
+            
+            result = parse_json(response)
+            validators = conditional_headers(response)
+            if validators and result:
+                _token_cache_put(validator_key, (validators, result))
         # Cache the result
         if result:
             self._cached_data[cache_key] = result
@@ -615,32 +703,18 @@ class Watch:
         for params in day_params:
             date_str = params.get('start_date')
             
-            url_template = URL_DICT.get(endpoint_type)
-            if not url_template:
+            # Only the intraday endpoints are ever split per day
+            if endpoint_type not in ('Heart Rate Intraday', 'Steps Intraday'):
                 continue
+            url = build_url(endpoint_type, params)
                 
-            if endpoint_type == 'Heart Rate Intraday':
-                url = url_template.format(
-                    params.get('start_date'),
-                    params.get('start_time'),
-                    params.get('end_time')
-                )
-            elif endpoint_type == 'Steps Intraday':
-                url = url_template.format(
-                    params.get('start_date'),
-                    params.get('start_time'),
-                    params.get('end_time')
-                )
-            else:
-                continue
-                
-            response = requests.get(url, headers=headers)
+            response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             
             if response.status_code != 200:
                 print(f"Error fetching {endpoint_type} data for {params.get('start_date')}: {response.status_code}")
                 continue
                 
-            day_result = response.json()
+            day_result = parse_json(response)
             
             if 'Heart Rate Intraday' in endpoint_type:
                 if 'activities-heart' in day_result:
@@ -734,7 +808,15 @@ class Watch:
     
     def update_device_info(self, force_fetch: bool = False) -> None:
         """Update device information (battery, sync time, etc.)"""
-        data = self.fetch_data('device', force_fetch=force_fetch)
+        cache_key = (self.token, 'device')
+        data = None if force_fetch else _token_cache_get(cache_key, DEVICE_CACHE_TTL)
+        if data is None:
+            data = self.fetch_data('device', force_fetch=force_fetch)
+            if data and isinstance(data, list):
+                _token_cache_put(cache_key, list(data))
+        else:
+            # The device filtering below edits the list in place
+            data = list(data)
         
         if data and isinstance(data, list) and len(data) > 0:
             device = data[-1]  # Get the first device
@@ -750,55 +832,67 @@ class Watch:
             sync_time = device.get('lastSyncTime')
             if sync_time:
                 try:
-                    self.last_sync_time = datetime.datetime.strptime(
-                        sync_time, "%Y-%m-%dT%H:%M:%S.%f"
-                    )
+                    self.last_sync_time = parse_fitbit_datetime(sync_time)
                 except ValueError:
-                    try:
-                        self.last_sync_time = datetime.datetime.strptime(
-                            sync_time, "%Y-%m-%dT%H:%M:%S.%fZ"
-                        )
-                    except ValueError:
-                        print(f"Could not parse sync time: {sync_time}")
+                    print(f"Could not parse sync time: {sync_time}")
     
     def get_current_hourly_HR(self, force_fetch: bool = False) -> Optional[int]:
         """Get the current hourly heart rate (convenience method)"""
-        current_date = datetime.datetime.now()
-        hour_ago = current_date - datetime.timedelta(hours=1)
+        cache_key = (self.token, 'HR')
+        if not force_fetch:
+            cached = _token_cache_get(cache_key, INTRADAY_CACHE_TTL)
+            if cached is not None:
+                return cached
+        
+        today, _, now, hour_ago, _ = _now_strings()
         
         data = self.fetch_data(
             'Heart Rate Intraday',
             force_fetch=force_fetch,
-            start_date=current_date,
+            start_date=today,
+            end_date=today,
             start_time=hour_ago,
-            end_time=current_date
+            end_time=now
         )
         
-        processed_data = self.process_data('Heart Rate Intraday', data)
+        # Only the latest sample is needed, so skip annotating the whole dataset
+        dataset = (data or {}).get('activities-heart-intraday', {}).get('dataset', [])
         
-        if processed_data and len(processed_data) > 0:
-            return processed_data[-1]['value']
+        if dataset:
+            value = dataset[-1]['value']
+            _token_cache_put(cache_key, value)
+            return value
         return None
     
     def get_current_hourly_steps(self, force_fetch: bool = False) -> Optional[int]:
         """Get the current hourly steps (convenience method)"""
-        current_date = datetime.datetime.now()
-        hours_ago = current_date - datetime.timedelta(hours=6)
+        cache_key = (self.token, 'steps')
+        if not force_fetch:
+            cached = _token_cache_get(cache_key, INTRADAY_CACHE_TTL)
+            if cached is not None:
+                return cached
+        
+        today, _, now, _, hours_ago = _now_strings()
         
         data = self.fetch_data(
             'Steps Intraday',
             force_fetch=force_fetch,
-            start_date=current_date,
+            start_date=today,
+            end_date=today,
             start_time=hours_ago,
-            end_time=current_date
+            end_time=now
         )
         
-        processed_data = self.process_data('Steps Intraday', data)
+        # Only the latest non-zero minute is needed, so skip annotating the whole dataset
+        dataset = (data or {}).get('activities-steps-intraday', {}).get('dataset', [])
         
-        if processed_data and len(processed_data) > 0:
-            for step_data in reversed(processed_data):
-                if step_data['value'] > 0:
-                    return step_data['value']
+        if dataset:
+            values = np.fromiter((item['value'] for item in dataset), dtype=np.int64, count=len(dataset))
+            nonzero = np.flatnonzero(values > 0)
+            if nonzero.size:
+                value = dataset[nonzero[-1]]['value']
+                _token_cache_put(cache_key, value)
+                return value
         return None
     
     def get_current_battery(self, force_fetch: bool = False) -> Optional[int]:
@@ -809,8 +903,13 @@ class Watch:
     
     def get_last_sleep_start_end(self, force_fetch: bool = False) -> tuple:
         """Get the last sleep start and end times (convenience method)"""
-        yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
-        today = datetime.datetime.now()
+        today, yesterday, _, _, _ = _now_strings()
+        
+        cache_key = (self.token, 'Sleep', today)
+        if not force_fetch:
+            cached = _token_cache_get(cache_key, SLEEP_CACHE_TTL)
+            if cached is not None:
+                return cached
         
         data = self.fetch_data(
             'Sleep',
@@ -823,7 +922,9 @@ class Watch:
         
         if processed_data and len(processed_data) > 0:
             sleep_record = processed_data[0]
-            return sleep_record.get('start_time'), sleep_record.get('end_time')
+            start_end = sleep_record.get('start_time'), sleep_record.get('end_time')
+            _token_cache_put(cache_key, start_end)
+            return start_end
         return None, None
     
     def get_last_sleep_duration(self, force_fetch: bool = False) -> Optional[float]:
@@ -832,21 +933,39 @@ class Watch:
         if not start_time or not end_time:
             return None
         try:
-            for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"]:
-                try:
-                    start_dt = datetime.datetime.strptime(start_time, fmt)
-                    end_dt = datetime.datetime.strptime(end_time, fmt)
-                    duration = (end_dt - start_dt).total_seconds() / 3600
-                    return duration
-                except ValueError:
-                    continue
-            
-            print(f"Could not parse sleep times after trying multiple formats")
+            return (parse_fitbit_datetime(end_time) - parse_fitbit_datetime(start_time)).total_seconds() / 3600
+        except ValueError:
+            print(f"Could not parse sleep times: {start_time}, {end_time}")
             return None
         except Exception as e:
             print(f"Error calculating sleep duration: {e}")
             return None
             
+    @classmethod
+    def fetch_dashboard_bulk(cls, watches: List['Watch'], force_fetch: bool = False) -> Dict[tuple, Any]:
+        """
+        Fetch the dashboard readings (HR, steps, battery, sleep) of every watch concurrently.
+        
+        Args:
+            watches: Watches to refresh
+            force_fetch: Bypass cached readings
+            
+        Returns:
+            Dict mapping (watch name, metric) to the reading, or None if that request failed
+        """
+        tasks = [(watch, metric) for watch in watches for metric in DASHBOARD_READERS]
+        
+        def read(task):
+            watch, metric = task
+            try:
+                return DASHBOARD_READERS[metric](watch, force_fetch)
+            except Exception as e:
+                print(f"Error fetching {metric} for watch {watch.name}: {e}")
+                return None
+        
+        results = map_watches(read, tasks, max_workers=DASHBOARD_WORKERS)
+        return {(watch.name, metric): result for (watch, metric), result in zip(tasks, results)}
+    
     def clear_cache(self) -> None:
         """Clear the cached data"""
         self._cached_data = {}
@@ -863,13 +982,13 @@ class Watch:
             List of dictionaries with date and missing data hint
         """
         url = f"https://api.fitbit.com/1/user/-/activities/heart/date/{start_date}/{end_date}.json"
-        response = requests.get(url, headers=self.header)
+        response = SESSION.get(url, headers=self.header, timeout=REQUEST_TIMEOUT)
         
         if response.status_code != 200:
             print(f"Error in quick_scan: {response.status_code}")
             return []
             
-        js = response.json()
+        js = parse_json(response)
         
         rows = []
         for d in js.get("activities-heart", []):
@@ -893,13 +1012,13 @@ class Watch:
             Number of minutes with heart rate data (0-1440)
         """
         url = f"https://api.fitbit.com/1/user/-/activities/heart/date/{date}/{date}/1min.json"
-        response = requests.get(url, headers=self.header)
+        response = SESSION.get(url, headers=self.header, timeout=REQUEST_TIMEOUT)
         
         if response.status_code != 200:
             print(f"Error in hr_minutes_one_day: {response.status_code}")
             return 0
             
-        js = response.json()
+        js = parse_json(response)
         
         meta = js.get("activities-heart-intraday", {})
         pts = len(meta.get("dataset", []))  # 1 point per minute
@@ -1011,11 +1130,79 @@ class WatchFactory:
 
 # ===== Utility Functions =====
 
-def get_headers(token: str) -> Dict:
-    """Get HTTP headers for Fitbit API requests"""
-    headers = HEADERS.copy()
-    headers['Authorization'] = headers['Authorization'].format(token)
-    return headers
+def get_headers(token: str) -> Dict[str, str]:
+    """Get the complete HTTP headers for Fitbit API requests, usable with or without SESSION"""
+    return {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+
+def _read_battery(watch: 'Watch', force_fetch: bool) -> Optional[int]:
+    watch.update_device_info(force_fetch=force_fetch)
+    return watch.battery_level
+
+
+# The independent Fitbit requests behind a watch's dashboard card
+DASHBOARD_READERS = {
+    'HR': lambda watch, force_fetch: watch.get_current_hourly_HR(force_fetch=force_fetch),
+    'steps': lambda watch, force_fetch: watch.get_current_hourly_steps(force_fetch=force_fetch),
+    'battery': _read_battery,
+    'sleep': lambda watch, force_fetch: watch.get_last_sleep_start_end(force_fetch=force_fetch),
+}
+
+
+_now_strings_cache: Dict[int, tuple] = {}
+
+
+def _now_strings() -> tuple:
+    """
+    Return (today, yesterday, now, an hour ago, six hours ago) as Fitbit date/time strings.
+    
+    Computed once per wall-clock second, so a dashboard refresh over many watches
+    formats them once instead of once per watch and metric.
+    """
+    second = int(time.time())
+    cached = _now_strings_cache.get(second)
+    if cached is None:
+        now = datetime.datetime.fromtimestamp(second)
+        cached = (
+            now.strftime("%Y-%m-%d"),
+            (now - datetime.timedelta(days=1)).strftime("%Y-%m-%d"),
+            now.strftime("%H:%M"),
+            (now - datetime.timedelta(hours=1)).strftime("%H:%M"),
+            (now - datetime.timedelta(hours=6)).strftime("%H:%M"),
+        )
+        # Only the current second is ever looked up again
+        _now_strings_cache.clear()
+        _now_strings_cache[second] = cached
+    return cached
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a Fitbit response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def conditional_headers(response: requests.Response) -> Dict[str, str]:
+    """Request headers that revalidate against response (If-None-Match / If-Modified-Since)"""
+    validators = {}
+    if response.headers.get('ETag'):
+        validators['If-None-Match'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['If-Modified-Since'] = response.headers['Last-Modified']
+    return validators
+
+def parse_fitbit_datetime(value: str) -> datetime.datetime:
+    """Parse a Fitbit ISO timestamp (optionally with fractional seconds and a trailing Z) as naive local time"""
+    # fromisoformat is implemented in C; before 3.11 it rejects a Z suffix, so drop it
+    return datetime.datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
+
+
+def map_watches(fn: Callable, items: List, max_workers: int = FETCH_WORKERS) -> List:
+    """Apply fn to every item on a thread pool, in order; each call is dominated by Fitbit API round trips"""
+    items = list(items)
+    if len(items) < 2:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
 
 def get_activity(project: str) -> bool:
     """Check if a project is active"""
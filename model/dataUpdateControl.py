@@ -13,8 +13,10 @@ import datetime
 
 
 # Import enhanced components
-from entity.Watch import Watch, WatchFactory
+from entity.Watch import Watch, WatchFactory, map_watches
 from entity.Project import Project, ProjectRepository
+from entity.Sheet import LegacySpreadsheet as Spreadsheet, ServerLogFile as serverLogFile
+
 
 def get_watch_details() -> pl.DataFrame:
     """
@@ -42,14 +44,7 @@ def get_watch_details() -> pl.DataFrame:
         'isActive': pl.Utf8,
     }
     
-    # Initialize with empty DataFrame with proper schema
-    new_rows = pl.DataFrame(schema=schema)
-    
-    # Use enhanced Watch class with the old Watch details
-    for row in watch_details:
-        if row.get('isActive', '').upper() == 'FALSE':
-            continue
-            
+    def fetch_row(row: Dict[str, Any]) -> Dict[str, str]:
         # Create a new Watch object using the enhanced class
         watch = Watch(
             name=row.get('name', ''),
@@ -57,27 +52,30 @@ def get_watch_details() -> pl.DataFrame:
             token=row.get('token', '')
         )
         
+        sleep_start, sleep_end = watch.get_last_sleep_start_end()
+        
         # Convert all values to strings to maintain type consistency
-        watch_dict = {
+        return {
             'project': str(watch.project or ""),
             'name': str(watch.name or ""),
             'syncDate': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             'battery': str(watch.get_current_battery() or ""),
             'HR': str(watch.get_current_hourly_HR() or ""),
             'steps': str(watch.get_current_hourly_steps() or ""),
-            'sleep_start': str(watch.get_last_sleep_start_end()[0] or ""),
-            'sleep_end': str(watch.get_last_sleep_start_end()[1] or ""),
+            'sleep_start': str(sleep_start or ""),
+            'sleep_end': str(sleep_end or ""),
             'sleep_duration': str(watch.get_last_sleep_duration() or ""),
             'isActive': str(watch.is_active or ""),
         }
+    
+    # Use enhanced Watch class with the old Watch details
+    active_rows = [row for row in watch_details if row.get('isActive', '').upper() != 'FALSE']
+    
+    # Each watch costs several Fitbit round trips, so fetch the watches concurrently
+    new_rows = map_watches(fetch_row, active_rows)
         
-        # Create DataFrame with the same schema
-        row_df = pl.DataFrame([watch_dict], schema=schema)
-        
-        # Concatenate with consistent schemas
-        new_rows = pl.concat([new_rows, row_df], how="vertical")
-        
-    return new_rows
+    # A single construction with the shared schema, instead of one concat per watch
+    return pl.DataFrame(new_rows, schema=schema)
 
 def update_log() -> None:
     """
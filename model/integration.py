@@ -5,8 +5,7 @@ This bridges the gap between cron job data collection and the new application ar
 from typing import List, Dict, Any, Optional
 import datetime
 
-from Spreadsheet_io.sheets import Spreadsheet as LegacySpreadsheet
-from entity.Sheet import Spreadsheet as EntitySpreadsheet, GoogleSheetsAdapter
+from entity.Sheet import Spreadsheet as EntitySpreadsheet, GoogleSheetsAdapter, LegacySpreadsheet
 from entity.Project import Project, ProjectRepository, ProjectFactory
 from entity.User import User, UserRepository, UserFactory
 from entity.Watch import Watch, WatchFactory, WatchAssignmentManager
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project root importable when running pytest from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+Sheet = pytest.importorskip("entity.Sheet")
+
+
+def test_zero_readings_count_as_failures():
+    row = {"syncDate": "2024-01-01 10:00", "HR": 0, "sleep_start": "", "steps": 0, "battery": 0}
+    assert Sheet._check_flags(row) == {
+        "okSync": True, "okHR": False, "okSleep": False, "okSteps": False, "okBattary": False,
+    }
+
+
+def test_missing_readings_count_as_failures():
+    assert not any(Sheet._check_flags({}).values())
+
+
+def test_non_empty_readings_pass():
+    row = {"syncDate": "2024-01-01 10:00", "HR": 61, "sleep_start": "2024-01-01 00:30",
+           "steps": "1200", "battery": "80%"}
+    assert all(Sheet._check_flags(row).values())
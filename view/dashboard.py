@@ -19,32 +19,27 @@ from entity.Watch import Watch, WatchFactory
 from model.config import get_secrets
 from entity.AsyncSheetsManager import AsyncSheetsManager
 
+# Which watches each role sees: (controller, user_email, user_project) -> DataFrame
+WATCH_LOOKUP_BY_ROLE = {
+    "Admin": lambda controller, user_email, user_project: controller.get_watches_for_project(user_project),
+    "Manager": lambda controller, user_email, user_project: controller.get_watches_for_project(user_project),
+    "Student": lambda controller, user_email, user_project: controller.get_watches_for_student(user_email),
+}
+
 # Increase cache time to reduce API calls
 # @st.cache_data(ttl=1800)  # Cache for 30 minutes instead of 5
 def cached_get_watches(user_email, user_role, user_project):
-    project_controller = ProjectController()
-    if user_role == "Admin":
-        return project_controller.get_watches_for_project(user_project)
-    elif user_role == "Manager":
-        return project_controller.get_watches_for_project(user_project)
-    elif user_role == "Student":
-        return project_controller.get_watches_for_student(user_email)
-    else:
+    lookup = WATCH_LOOKUP_BY_ROLE.get(user_role)
+    if lookup is None:
         return pd.DataFrame()
+    return lookup(ProjectController(), user_email, user_project)
 
 # Add warm-up function for background prefetching
 def prefetch_watch_data(user_email, user_role, user_project):
     """Prefetch watches data in the background to warm up cache"""
     try:
         # This will populate the cache without showing any errors to the user
-        project_controller = ProjectController()
-        if user_role == "Admin":
-            return project_controller.get_watches_for_project(user_project)
-        elif user_role == "Manager":
-            return project_controller.get_watches_for_project(user_project)
-        elif user_role == "Student":
-            return project_controller.get_watches_for_student(user_email)
-        return pd.DataFrame()
+        return cached_get_watches(user_email, user_role, user_project)
     except Exception:
         # Silent fail for background tasks
         return pd.DataFrame()
@@ -689,18 +684,19 @@ def display_dashboard(user_email, user_role, user_project, sp: Spreadsheet) -> N
                         # Only make API calls when refresh button is clicked
                         if refresh_device:
                             with st.spinner("Fetching latest data from Fitbit API...",show_time=True):
-                                # Force fetch fresh data from the API
-                                watch.update_device_info(force_fetch=True)
+                                # Force fetch fresh data from the API, all four endpoints at once
+                                readings = Watch.fetch_dashboard_bulk([watch], force_fetch=True)
                                 
                                 # Update watch_details with fresh data from the API
                                 st.session_state.watch_details[st.session_state.selected_watch]['lastBatteryLevel'] = watch.battery_level
                                 st.session_state.watch_details[st.session_state.selected_watch]['lastSynced'] = watch.last_sync_time.isoformat() if watch.last_sync_time else ""
-                                st.session_state.watch_details[st.session_state.selected_watch]['lastHeartRate'] = watch.get_current_hourly_HR(force_fetch=True) or ""
-                                st.session_state.watch_details[st.session_state.selected_watch]['lastSteps'] = watch.get_current_hourly_steps(force_fetch=True) or ""
-                                sleep_start, sleep_end = watch.get_last_sleep_start_end(force_fetch=True)
+                                st.session_state.watch_details[st.session_state.selected_watch]['lastHeartRate'] = readings[(watch.name, 'HR')] or ""
+                                st.session_state.watch_details[st.session_state.selected_watch]['lastSteps'] = readings[(watch.name, 'steps')] or ""
+                                sleep_start, sleep_end = readings[(watch.name, 'sleep')] or (None, None)
                                 st.session_state.watch_details[st.session_state.selected_watch]['lastSleepStart'] = sleep_start or ""
                                 st.session_state.watch_details[st.session_state.selected_watch]['lastSleepEnd'] = sleep_end or ""
-                                st.session_state.watch_details[st.session_state.selected_watch]['lastSleepDuration'] = watch.get_last_sleep_duration(force_fetch=True) or ""
+                                # Served from the sleep reading fetched above
+                                st.session_state.watch_details[st.session_state.selected_watch]['lastSleepDuration'] = watch.get_last_sleep_duration() or ""
                                 
                                 st.success("✅ Device data refreshed successfully!")
                         else:
@@ -724,135 +724,145 @@ def display_fitbit_log_table(user_email, user_role, user_project, spreadsheet: S
             
             # Let user select a watch to view historical data
             watch_options = sorted(fitbit_log_df['watchName'].unique().to_list())
-            if watch_options:
-                selected_watch = st.selectbox("Select Watch for History:", watch_options)
-                
-                # Get historical data for the selected watch - get all records, not just latest
-                watch_history = filtered_df.filter(pl.col('watchName') == selected_watch).sort('lastCheck')
-                
-                # Add debug info to help troubleshoot visualization issues
-                st.write(f"Found {watch_history.height} historical records for {selected_watch}")
-                
-                if not watch_history.is_empty():
-                    # Create tabs for different metrics
-                    tab1, tab2, tab3, tab4 = st.tabs(["Battery", "Heart Rate", "Steps", "Sleep"])
-                    
-                    with tab1:
-                        # Clean and convert battery values
-                        # Handle both string and numeric types for battery values
-                        battery_df = watch_history.with_columns(
-                            pl.when(pl.col('lastBattaryVal').cast(pl.Utf8).str.contains('%'))
-                            .then(
-                                pl.col('lastBattaryVal')
-                                .cast(pl.Utf8)
-                                .str.replace('%', '')
-                                .cast(pl.Float64, strict=False)
-                            )
-                            .otherwise(pl.col('lastBattaryVal').cast(pl.Float64, strict=False))
-                            .alias('battery_num')
-                        ).select(['lastCheck', 'battery_num']).drop_nulls()
-                        
-                        st.write(f"Battery data points: {battery_df.height}")
-                        if not battery_df.is_empty():
-                            # Ensure data is properly sorted by time
-                            battery_df = battery_df.sort('lastCheck')
-                            
-                            # Convert to pandas for plotly compatibility
-                            battery_pd_df = battery_df.to_pandas()
-                            fig = px.line(battery_pd_df, x='lastCheck', y='battery_num', 
-                                         title=f"Battery History - {selected_watch}",
-                                         labels={'lastCheck': 'Time', 'battery_num': 'Battery Level (%)'},
-                                         range_y=[0, 100])
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No battery data available for this watch")
-                    
-                    with tab2:
-                        # Convert HR values to numeric with better handling
-                        hr_df = watch_history.with_columns(
-                            pl.col('lastHRVal').cast(pl.Float64, strict=False).alias('hr_num')
-                        ).select(['lastCheck', 'hr_num']).drop_nulls()
-                        
-                        st.write(f"Heart rate data points: {hr_df.height}")
-                        if not hr_df.is_empty():
-                            # Ensure data is properly sorted by time
-                            hr_df = hr_df.sort('lastCheck')
-                            
-                            # Convert to pandas for plotly compatibility
-                            hr_pd_df = hr_df.to_pandas()
-                            fig = px.line(hr_pd_df, x='lastCheck', y='hr_num', 
-                                         title=f"Heart Rate History - {selected_watch}",
-                                         labels={'lastCheck': 'Time', 'hr_num': 'Heart Rate (bpm)'})
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No heart rate data available for this watch")
-                    
-                    with tab3:
-                        # Clean and convert steps values
-                        steps_df = watch_history.with_columns(
-                            pl.col('lastStepsVal').cast(pl.Float64, strict=False).alias('steps_num')
-                        ).select(['lastCheck', 'steps_num']).drop_nulls()
-                        
-                        st.write(f"Steps data points: {steps_df.height}")
-                        if not steps_df.is_empty():
-                            # Ensure data is properly sorted by time
-                            steps_df = steps_df.sort('lastCheck')
-                            
-                            # Convert to pandas for plotly compatibility
-                            steps_pd_df = steps_df.to_pandas()
-                            fig = px.bar(steps_pd_df, x='lastCheck', y='steps_num', 
-                                        title=f"Steps History - {selected_watch}",
-                                        labels={'lastCheck': 'Time', 'steps_num': 'Steps'})
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No steps data available for this watch")
-                    
-                    with tab4:
-                        # Try both the calculated sleep duration and the stored one
-                        sleep_col = 'calculated_sleep_dur' if 'calculated_sleep_dur' in watch_history.columns else 'lastSleepDur'
-                        sleep_df = watch_history.with_columns(
-                            pl.col(sleep_col).cast(pl.Float64, strict=False).alias('sleep_min')
-                        ).select(['lastCheck', 'sleep_min']).drop_nulls()
-                        
-                        st.write(f"Sleep data points: {sleep_df.height}")
-                        if not sleep_df.is_empty():
-                            # Ensure data is properly sorted by time
-                            sleep_df = sleep_df.sort('lastCheck')
-                            
-                            # Convert to pandas for plotly compatibility
-                            sleep_pd_df = sleep_df.to_pandas()
-                            fig = px.bar(sleep_pd_df, x='lastCheck', y='sleep_min', 
-                                        title=f"Sleep Duration History - {selected_watch}",
-                                        labels={'lastCheck': 'Date', 'sleep_min': 'Sleep Duration (min)'})
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.info("No sleep data available for this watch")
-                    
-                    # If all visualizations are empty, show the raw data
-                    if (battery_df.height + hr_df.height + steps_df.height + sleep_df.height) == 0:
-                        st.warning("No visualization data available. Here's the raw data for troubleshooting:")
-                        # st.dataframe(watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']).head(10))
-                        # gd = GridOptionsBuilder.from_dataframe(
-                        #     watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']).to_pandas()
-                        # )
-                        # configure_filters_from_polars(gd, watch_history)
-                        edited_df_wh, grid_response_wh = aggrid_polars( watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']))
-                        # AgGrid(
-                        #     watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']).to_pandas(),
-                        #     gridOptions=gd.build(),
-                        #     fit_columns_on_grid_load=True,
-                        #     theme="streamlit"
-                        # )
-                else:
-                    st.info(f"No historical data available for {selected_watch}")
-            else:
-                st.info("No watches available for visualization")
+            display_watch_history(watch_options, filtered_df)
                 
         except Exception as e:
             st.error(f"Error displaying Fitbit log data: {e}")
             # Add debugging info if needed
             st.exception(e)
 
+@st.fragment
+def display_watch_history(watch_options: List[str], filtered_df: pl.DataFrame) -> None:
+    """Watch history charts; a fragment, so picking another watch reruns only this section"""
+    try:
+        if watch_options:
+            selected_watch = st.selectbox("Select Watch for History:", watch_options)
+
+            # Get historical data for the selected watch - get all records, not just latest
+            watch_history = filtered_df.filter(pl.col('watchName') == selected_watch).sort('lastCheck')
+
+            # Add debug info to help troubleshoot visualization issues
+            st.write(f"Found {watch_history.height} historical records for {selected_watch}")
+
+            if not watch_history.is_empty():
+                # Create tabs for different metrics
+                tab1, tab2, tab3, tab4 = st.tabs(["Battery", "Heart Rate", "Steps", "Sleep"])
+
+                with tab1:
+                    # Clean and convert battery values
+                    # Handle both string and numeric types for battery values
+                    battery_df = watch_history.with_columns(
+                        pl.when(pl.col('lastBattaryVal').cast(pl.Utf8).str.contains('%'))
+                        .then(
+                            pl.col('lastBattaryVal')
+                            .cast(pl.Utf8)
+                            .str.replace('%', '')
+                            .cast(pl.Float64, strict=False)
+                        )
+                        .otherwise(pl.col('lastBattaryVal').cast(pl.Float64, strict=False))
+                        .alias('battery_num')
+                    ).select(['lastCheck', 'battery_num']).drop_nulls()
+
+                    st.write(f"Battery data points: {battery_df.height}")
+                    if not battery_df.is_empty():
+                        # Ensure data is properly sorted by time
+                        battery_df = battery_df.sort('lastCheck')
+
+                        # Convert to pandas for plotly compatibility
+                        battery_pd_df = battery_df.to_pandas()
+                        fig = px.line(battery_pd_df, x='lastCheck', y='battery_num', 
+                                     title=f"Battery History - {selected_watch}",
+                                     labels={'lastCheck': 'Time', 'battery_num': 'Battery Level (%)'},
+                                     range_y=[0, 100])
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.info("No battery data available for this watch")
+
+                with tab2:
+                    # Convert HR values to numeric with better handling
+                    hr_df = watch_history.with_columns(
+                        pl.col('lastHRVal').cast(pl.Float64, strict=False).alias('hr_num')
+                    ).select(['lastCheck', 'hr_num']).drop_nulls()
+
+                    st.write(f"Heart rate data points: {hr_df.height}")
+                    if not hr_df.is_empty():
+                        # Ensure data is properly sorted by time
+                        hr_df = hr_df.sort('lastCheck')
+
+                        # Convert to pandas for plotly compatibility
+                        hr_pd_df = hr_df.to_pandas()
+                        fig = px.line(hr_pd_df, x='lastCheck', y='hr_num', 
+                                     title=f"Heart Rate History - {selected_watch}",
+                                     labels={'lastCheck': 'Time', 'hr_num': 'Heart Rate (bpm)'})
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.info("No heart rate data available for this watch")
+
+                with tab3:
+                    # Clean and convert steps values
+                    steps_df = watch_history.with_columns(
+                        pl.col('lastStepsVal').cast(pl.Float64, strict=False).alias('steps_num')
+                    ).select(['lastCheck', 'steps_num']).drop_nulls()
+
+                    st.write(f"Steps data points: {steps_df.height}")
+                    if not steps_df.is_empty():
+                        # Ensure data is properly sorted by time
+                        steps_df = steps_df.sort('lastCheck')
+
+                        # Convert to pandas for plotly compatibility
+                        steps_pd_df = steps_df.to_pandas()
+                        fig = px.bar(steps_pd_df, x='lastCheck', y='steps_num', 
+                                    title=f"Steps History - {selected_watch}",
+                                    labels={'lastCheck': 'Time', 'steps_num': 'Steps'})
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.info("No steps data available for this watch")
+
+                with tab4:
+                    # Try both the calculated sleep duration and the stored one
+                    sleep_col = 'calculated_sleep_dur' if 'calculated_sleep_dur' in watch_history.columns else 'lastSleepDur'
+                    sleep_df = watch_history.with_columns(
+                        pl.col(sleep_col).cast(pl.Float64, strict=False).alias('sleep_min')
+                    ).select(['lastCheck', 'sleep_min']).drop_nulls()
+
+                    st.write(f"Sleep data points: {sleep_df.height}")
+                    if not sleep_df.is_empty():
+                        # Ensure data is properly sorted by time
+                        sleep_df = sleep_df.sort('lastCheck')
+
+                        # Convert to pandas for plotly compatibility
+                        sleep_pd_df = sleep_df.to_pandas()
+                        fig = px.bar(sleep_pd_df, x='lastCheck', y='sleep_min', 
+                                    title=f"Sleep Duration History - {selected_watch}",
+                                    labels={'lastCheck': 'Date', 'sleep_min': 'Sleep Duration (min)'})
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.info("No sleep data available for this watch")
+
+                # If all visualizations are empty, show the raw data
+                if (battery_df.height + hr_df.height + steps_df.height + sleep_df.height) == 0:
+                    st.warning("No visualization data available. Here's the raw data for troubleshooting:")
+                    # st.dataframe(watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']).head(10))
+                    # gd = GridOptionsBuilder.from_dataframe(
+                    #     watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']).to_pandas()
+                    # )
+                    # configure_filters_from_polars(gd, watch_history)
+                    edited_df_wh, grid_response_wh = aggrid_polars( watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']))
+                    # AgGrid(
+                    #     watch_history.select(['lastCheck', 'lastBattaryVal', 'lastHRVal', 'lastStepsVal', 'lastSleepDur']).to_pandas(),
+                    #     gridOptions=gd.build(),
+                    #     fit_columns_on_grid_load=True,
+                    #     theme="streamlit"
+                    # )
+            else:
+                st.info(f"No historical data available for {selected_watch}")
+        else:
+            st.info("No watches available for visualization")
+    except Exception as e:
+        st.error(f"Error displaying watch history: {e}")
+        st.exception(e)
+
+
 def convert_min_to_hours(minutes_value):
     """Convert minutes to hours with 2 decimal places"""
     try: